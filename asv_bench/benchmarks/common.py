@@ -0,0 +1,73 @@
+"""
+Helpers shared by the benchmarks.
+
+The ``DASK_CUDF_BENCH_BACKEND`` environment variable selects what runs:
+
+- ``cudf`` (default) benchmarks dask_cudf on the GPU.
+- ``pandas`` runs the dask.dataframe counterpart of the benchmarks that
+  have one on pandas partitions, to collect baselines on CPU-only
+  machines.  Benchmarks of algorithms specific to dask_cudf (the sorting
+  network, the hash join and approximate distinct counts) have no
+  counterpart and are skipped.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+BACKEND = os.environ.get("DASK_CUDF_BENCH_BACKEND", "cudf")
+
+#: Row and partition counts most benchmarks are parametrized over
+NROWS = [10 ** 4, 10 ** 6]
+NPARTITIONS = [1, 8, 64]
+
+
+def make_frame(nrows, nkeys=1000, seed=0):
+    """Random pandas frame with an integer key and two value columns"""
+    rng = np.random.RandomState(seed)
+    return pd.DataFrame(
+        {
+            "key": rng.randint(0, nkeys, size=nrows),
+            "x": rng.randint(0, 10 ** 6, size=nrows),
+            "y": rng.normal(size=nrows),
+        }
+    )
+
+
+def from_pandas(df, npartitions):
+    """Partitioned collection of *df* on the selected backend"""
+    if BACKEND == "cudf":
+        import cudf
+        import dask_cudf
+
+        gdf = cudf.DataFrame.from_pandas(df)
+        return dask_cudf.from_cudf(gdf, npartitions=npartitions)
+    import dask.dataframe as dd
+
+    return dd.from_pandas(df, npartitions=npartitions)
+
+
+def read_csv(path, chunksize):
+    if BACKEND == "cudf":
+        import dask_cudf
+
+        return dask_cudf.read_csv(path, chunksize=chunksize)
+    import dask.dataframe as dd
+
+    return dd.read_csv(path, blocksize=chunksize)
+
+
+def require_gpu():
+    """Skip a benchmark of an algorithm specific to dask_cudf"""
+    if BACKEND != "cudf":
+        # asv skips benchmarks whose setup raises NotImplementedError
+        raise NotImplementedError("only runs with the cudf backend")
+
+
+def ntasks(collection):
+    """Number of tasks in the graph of *collection*"""
+    return len(dict(collection.dask))
+
+
+def run(collection):
+    return collection.compute(scheduler="single-threaded")
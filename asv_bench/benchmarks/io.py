@@ -0,0 +1,28 @@
+import os
+import shutil
+import tempfile
+
+from .common import NROWS, make_frame, ntasks, read_csv, run
+
+
+class ReadCSV(object):
+    params = (NROWS, ["64 kiB", "16 MiB"])
+    param_names = ["nrows", "chunksize"]
+    timeout = 300
+
+    def setup(self, nrows, chunksize):
+        self.tmpdir = tempfile.mkdtemp(prefix="dask-cudf-bench-")
+        self.path = os.path.join(self.tmpdir, "data.csv")
+        make_frame(nrows).to_csv(self.path, index=False)
+
+    def teardown(self, nrows, chunksize):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def time_build(self, nrows, chunksize):
+        read_csv(self.path, chunksize)
+
+    def time_read_csv(self, nrows, chunksize):
+        run(read_csv(self.path, chunksize))
+
+    def track_ntasks(self, nrows, chunksize):
+        return ntasks(read_csv(self.path, chunksize))
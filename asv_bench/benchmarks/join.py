@@ -0,0 +1,30 @@
+from .common import NPARTITIONS, NROWS, from_pandas, make_frame, ntasks, run
+from .common import require_gpu
+
+
+def merge(left, right, on):
+    return left.merge(right, on=(on,), how="left")
+
+
+class MergeLeft(object):
+    """Hash join of ``merge(how="left")``"""
+
+    params = (NROWS, NPARTITIONS)
+    param_names = ["nrows", "npartitions"]
+    timeout = 300
+
+    def setup(self, nrows, npartitions):
+        require_gpu()
+        left = make_frame(nrows, seed=0)
+        right = make_frame(max(nrows // 10, 1), seed=1)
+        self.left = from_pandas(left, npartitions).persist()
+        self.right = from_pandas(right, max(npartitions // 4, 1)).persist()
+
+    def time_build(self, nrows, npartitions):
+        merge(self.left, self.right, "key")
+
+    def time_merge(self, nrows, npartitions):
+        run(merge(self.left, self.right, "key"))
+
+    def track_ntasks(self, nrows, npartitions):
+        return ntasks(merge(self.left, self.right, "key"))
@@ -0,0 +1,30 @@
+from .common import NPARTITIONS, NROWS, from_pandas, make_frame, ntasks, run
+from .common import require_gpu
+
+
+class Reductions(object):
+    params = (NROWS, NPARTITIONS, ["sum", "mean", "nunique", "nlargest"])
+    param_names = ["nrows", "npartitions", "reduction"]
+
+    def setup(self, nrows, npartitions, reduction):
+        if reduction == "nunique":
+            # HyperLogLog sketches of nunique_approx
+            require_gpu()
+        self.ddf = from_pandas(make_frame(nrows), npartitions).persist()
+
+    def _build(self, reduction):
+        s = self.ddf.x
+        if reduction == "nunique":
+            return s.nunique_approx()
+        elif reduction == "nlargest":
+            return s.nlargest(10)
+        return getattr(s, reduction)()
+
+    def time_build(self, nrows, npartitions, reduction):
+        self._build(reduction)
+
+    def time_reduce(self, nrows, npartitions, reduction):
+        run(self._build(reduction))
+
+    def track_ntasks(self, nrows, npartitions, reduction):
+        return ntasks(self._build(reduction))
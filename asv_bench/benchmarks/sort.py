@@ -0,0 +1,24 @@
+from .common import NPARTITIONS, NROWS, from_pandas, make_frame, ntasks, run
+from .common import require_gpu
+
+
+class SortValues(object):
+    """Batcher's sorting network of ``sort_values``.
+
+    Building the graph already counts the non-empty partitions, so there is
+    no separate graph construction benchmark.
+    """
+
+    params = (NROWS, NPARTITIONS)
+    param_names = ["nrows", "npartitions"]
+    timeout = 300
+
+    def setup(self, nrows, npartitions):
+        require_gpu()
+        self.ddf = from_pandas(make_frame(nrows), npartitions).persist()
+
+    def time_sort(self, nrows, npartitions):
+        run(self.ddf.sort_values("x"))
+
+    def track_ntasks(self, nrows, npartitions):
+        return ntasks(self.ddf.sort_values("x"))
@@ -6,7 +6,7 @@ from .core import (
     concat,
     from_delayed,
 )
-from .io import read_csv
+from .io import read_csv, read_parquet
 from . import backends
 
 from cudf._version import get_versions
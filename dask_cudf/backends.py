@@ -1,7 +1,20 @@
 from dask.dataframe.methods import concat_dispatch
 from dask.dataframe.core import get_parallel_type, meta_nonempty, make_meta
+from dask.sizeof import sizeof
 import cudf
+import numpy as np
 
+from . import utils
+from .join_impl import hash_partition
+from .sketches import (
+    hll_code_func,
+    hll_registers,
+    hll_sketch,
+    make_summary,
+    quantile_summary,
+    summary_from_sorted,
+    summary_positions,
+)
 from .core import DataFrame, Series, Index
 
 
@@ -12,8 +25,7 @@ get_parallel_type.register(cudf.Index, lambda _: Index)
 
 @meta_nonempty.register((cudf.DataFrame, cudf.Series, cudf.Index))
 def _(x):
-    y = meta_nonempty(x.to_pandas())  # TODO: add iloc[:5]
-    return cudf.from_pandas(y)
+    return utils.meta_nonempty(x)
 
 
 @make_meta.register((cudf.Series, cudf.DataFrame))
@@ -26,9 +38,55 @@ def _(x):
     return x[:0]
 
 
+@sizeof.register(cudf.DataFrame)
+def _(x):
+    return sum(sizeof(x[k]) for k in x.columns) + sizeof(x.index)
+
+
+@sizeof.register((cudf.Series, cudf.Index))
+def _(x):
+    if isinstance(x, cudf.dataframe.index.RangeIndex):
+        return 0
+    col = x._column if isinstance(x, cudf.Series) else x.as_column()
+    nbytes = col.data.size * col.data.dtype.itemsize
+    if col.has_null_mask:
+        nbytes += col.mask.size * col.mask.dtype.itemsize
+    return int(nbytes)
+
+
 @concat_dispatch.register((cudf.DataFrame, cudf.Series, cudf.Index))
 def _(dfs, axis=0, join="outer", uniform=False, filter_warning=True):
     assert axis == 0
     assert join == "outer"
     assert filter_warning is True
     return cudf.concat(dfs)
+
+
+@hash_partition.register(cudf.DataFrame)
+def _(frame, columns, nparts):
+    return dict(
+        enumerate(frame.partition_by_hash(columns=list(columns), nparts=nparts))
+    )
+
+
+@hll_sketch.register(cudf.Series)
+def _(x, precision):
+    x = x.dropna()
+    if not len(x):
+        return hll_registers([], precision)
+    # Encode on the device, only the distinct codes are copied to the host
+    codes = x.hash_values().applymap(hll_code_func(precision)).unique()
+    return hll_registers(codes.to_array(), precision)
+
+
+@quantile_summary.register(cudf.Series)
+def _(x, size):
+    x = x.dropna()
+    n = len(x)
+    if not n:
+        return summary_from_sorted(np.empty(0, dtype=x.dtype), size)
+    # Sort on the device, only the summary points are copied to the host
+    x = x.sort_values()
+    points = x.take(summary_positions(n, size)).to_array()
+    lo, hi = x.take([0, n - 1]).to_array()
+    return make_summary(points, n, lo, hi)
@@ -4,6 +4,7 @@ Adapted from https://en.wikipedia.org/wiki/Batcher_odd%E2%80%93even_mergesort
 """
 import math
 
+import numpy as np
 from dask import compute, delayed
 
 import cudf as gd
@@ -68,24 +69,75 @@ def _pad_data_to_length(parts):
     return parts + [None] * padn, len(parts)
 
 
-def _compare_frame(a, b, max_part_size, by):
+def _normalize_keys(by, ascending):
+    """Return *by* as a list of columns and a matching list of directions"""
+    by = [by] if isinstance(by, str) else list(by)
+    if isinstance(ascending, bool):
+        ascending = [ascending] * len(by)
+    ascending = list(ascending)
+    if len(ascending) != len(by):
+        raise ValueError(
+            "Length of ascending (%d) != length of by (%d)" % (len(ascending), len(by))
+        )
+    return by, ascending
+
+
+def _key_order(key, ascending, na_position):
+    """Stable order of the Series *key*, with its nulls kept in their current
+    order and placed according to *na_position*"""
+    if not key.null_count:
+        return key.argsort(ascending=ascending)
+    mask = key.isnull()
+    positions = gd.Series(np.arange(len(key), dtype=np.int64))
+    valid = key[~mask].argsort(ascending=ascending)
+    order = positions[~mask].take(valid.to_gpu_array())
+    nulls = positions[mask]
+    return gd.concat([nulls, order] if na_position == "first" else [order, nulls])
+
+
+def _sort_frame(df, by, ascending=True, na_position="last"):
+    """Sort *df* lexicographically by the columns in *by*.
+
+    The row permutation is built from the key columns alone: each key,
+    gathered through the permutation so far, is sorted stably from the last
+    key to the first and the orders are composed.  The frame itself is
+    gathered once at the end, and no compound key column is materialized.
+    Nulls of every key are placed according to *na_position*.
+    """
+    if na_position not in ("first", "last"):
+        raise ValueError("na_position must be 'first' or 'last'")
+    by, ascending = _normalize_keys(by, ascending)
+    perm = None
+    for col, asc in reversed(list(zip(by, ascending))):
+        key = df[col] if perm is None else df[col].take(perm.to_gpu_array())
+        order = _key_order(key, asc, na_position)
+        perm = order if perm is None else perm.take(order.to_gpu_array())
+    if perm is None:
+        return df
+    return df.take(perm.to_gpu_array())
+
+
+def _compare_frame(a, b, max_part_size, by, ascending=True, na_position="last"):
+    def sort(df):
+        return _sort_frame(df, by, ascending=ascending, na_position=na_position)
+
     if a is not None and b is not None:
         joint = gd.concat([a, b])
-        sorten = joint.sort_values(by=by)
+        sorten = sort(joint)
         # Split the sorted frame using the *max_part_size*
         lhs, rhs = sorten[:max_part_size], sorten[max_part_size:]
         # Replace empty frame with None
-        return lhs or None, rhs or None
+        return (lhs if len(lhs) else None), (rhs if len(rhs) else None)
     elif a is None and b is None:
         return None, None
     elif a is None:
-        return b.sort_values(by=by), None
+        return sort(b), None
     else:
-        return a.sort_values(by=by), None
+        return sort(a), None
 
 
-def _compare_and_swap_frame(parts, a, b, max_part_size, by):
-    compared = delayed(_compare_frame)(parts[a], parts[b], max_part_size, by=by)
+def _compare_and_swap_frame(parts, a, b, max_part_size, **kwargs):
+    compared = delayed(_compare_frame)(parts[a], parts[b], max_part_size, **kwargs)
     parts[a] = compared[0]
     parts[b] = compared[1]
 
@@ -99,19 +151,25 @@ def _cleanup(df):
     return out
 
 
-def sort_delayed_frame(parts, by):
+def sort_delayed_frame(parts, by, ascending=True, na_position="last"):
     """
     Parameters
     ----------
     parts :
         Delayed partitions of cudf.DataFrame
-    by : str
-        Column name by which to sort
+    by : str or list[str]
+        Column name(s) by which to sort, compared lexicographically
+    ascending : bool or list[bool]
+        Sort direction, for all keys or for each key of *by*
+    na_position : {'last', 'first'}
+        Where to put the nulls of each key
 
     The sort will also rebalance the partition sizes so that all output
     partitions has partition size of atmost `max(original_partition_sizes)`.
     Therefore, they may be fewer partitions in the output.
     """
+    by, ascending = _normalize_keys(by, ascending)
+    kwargs = dict(by=by, ascending=ascending, na_position=na_position)
     # Empty frame?
     if len(parts) == 0:
         return parts
@@ -124,10 +182,10 @@ def sort_delayed_frame(parts, by):
     if len(parts) > 1:
         # Build batcher's odd-even sorting network
         for a, b in oddeven_merge_sort(len(parts)):
-            _compare_and_swap_frame(parts, a, b, max_part_size, by=by)
+            _compare_and_swap_frame(parts, a, b, max_part_size, **kwargs)
     # Single input?
     else:
-        parts = [delayed(lambda x: x.sort_values(by=by))(parts[0])]
+        parts = [delayed(_sort_frame)(parts[0], **kwargs)]
     # Count number of non-empty partitions
     valid_ct = delayed(sum)(
         list(map(delayed(lambda x: int(x is not None)), parts[:valid]))
@@ -1,31 +1,38 @@
 # Copyright (c) 2018, NVIDIA CORPORATION.
 
+import operator
+import threading
 from collections import OrderedDict
 from math import ceil
 from uuid import uuid4
 
 import dask
 import dask.dataframe as dd
+import dask.local
+import dask.threaded
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from dask import compute
 from dask.base import normalize_token, tokenize
 from dask.compatibility import apply
 from dask.context import _globals
-from dask.core import flatten
-from dask.dataframe import from_delayed
+from dask.core import flatten, istask
+from dask.dataframe import methods
 from dask.dataframe.core import Scalar
 from dask.dataframe.utils import raise_on_meta_error
-from dask.delayed import delayed
+from dask.delayed import Delayed, delayed
 from dask.optimization import cull, fuse
-from dask.utils import M, OperatorMethodMixin, funcname
+from dask.sizeof import sizeof
+from dask.utils import M, OperatorMethodMixin, funcname, parse_bytes
 from libgdf_cffi import libgdf
-from toolz import partition_all
+from numba import cuda
+from toolz import merge_sorted, partition_all, unique
 
 import cudf
-from dask_cudf import batcher_sortnet, join_impl
+from dask_cudf import batcher_sortnet, join_impl, sketches
 from dask_cudf.accessor import CachedAccessor, CategoricalAccessor, DatetimeAccessor
-from dask_cudf.utils import make_meta
+from dask_cudf.utils import Schema, check_schema, make_meta, null_column
 
 
 def optimize(dsk, keys, **kwargs):
@@ -42,9 +49,86 @@ def optimize(dsk, keys, **kwargs):
 
 
 def finalize(results):
+    if len(results) == 1:
+        return results[0]
     return cudf.concat(results)
 
 
+class _PartitionChannel(object):
+    """Hands the partitions computed by `iter_partitions` over to the
+    consumer, and holds the scheduler back while the consumer lags behind.
+    """
+
+    def __init__(self):
+        self.parts = {}
+        self.taken = 0
+        self.done = False
+        self.error = None
+        self.closed = False
+        self.cond = threading.Condition()
+
+    def put(self, i, part):
+        with self.cond:
+            if not self.closed:
+                self.parts[i] = part
+                self.cond.notify_all()
+
+    def wait_taken(self, i, *after):
+        """Block until the consumer has taken partition *i*"""
+        with self.cond:
+            while self.taken <= i and not self.closed:
+                self.cond.wait()
+            if self.closed:
+                raise RuntimeError("The partitions are no longer consumed")
+
+    def take(self, i):
+        with self.cond:
+            while i not in self.parts and not self.done:
+                self.cond.wait()
+            if i not in self.parts:
+                raise self.error
+            self.taken = i + 1
+            self.cond.notify_all()
+            return self.parts.pop(i)
+
+    def finish(self, error=None):
+        with self.cond:
+            self.done = True
+            self.error = error
+            self.cond.notify_all()
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.parts.clear()
+            self.cond.notify_all()
+
+
+def _after(gate, value):
+    return value
+
+
+def _run_stream(schedule, dsk, keys, channel, kwargs):
+    try:
+        schedule(dsk, keys, **kwargs)
+    except BaseException as e:
+        channel.finish(e)
+    else:
+        channel.finish(RuntimeError("A partition was not computed"))
+
+
+def _column_piece(df, column):
+    return df[column].set_index(cudf.RangeIndex(0, len(df)))
+
+
+def _index_piece(df):
+    return df.index
+
+
+def _assemble_columns(columns, pieces, index):
+    return cudf.DataFrame(list(zip(columns, pieces))).set_index(index)
+
+
 class _Frame(dd.core._Frame, OperatorMethodMixin):
     """ Superclass for DataFrame and Series
 
@@ -83,24 +167,305 @@ class _Frame(dd.core._Frame, OperatorMethodMixin):
         self._meta = meta
         self.divisions = tuple(divisions)
 
+    @property
+    def _meta(self):
+        if self._meta_obj is None:
+            self._meta_obj = self._schema.to_meta()
+        return self._meta_obj
+
+    @_meta.setter
+    def _meta(self, meta):
+        self._meta_obj = meta
+        self._schema = None
+
     def __getstate__(self):
-        return (self.dask, self._name, self._meta, self.divisions)
+        # Pickle the lightweight schema rather than a device-backed meta
+        schema = self._schema or Schema.of(self._meta)
+        return (self.dask, self._name, schema or self._meta, self.divisions)
 
     def __setstate__(self, state):
-        self.dask, self._name, self._meta, self.divisions = state
+        self.dask, self._name, meta, self.divisions = state
+        if isinstance(meta, Schema):
+            self._meta_obj = None
+            self._schema = meta
+        else:
+            self._meta = meta
 
     def __repr__(self):
         s = "<dask_cudf.%s | %d tasks | %d npartitions>"
         return s % (type(self).__name__, len(self.dask), self.npartitions)
 
+    def persist(self, cache=None, drop_empty=False, **kwargs):
+        """Persist this collection into memory
+
+        Parameters
+        ----------
+        cache : dask_cudf.spill.PartitionCache, optional
+            Hold the partitions in *cache*, which spills the least recently
+            used ones to host memory and disk once its device budget is
+            exceeded.  By default all partitions stay on the device.
+        drop_empty : bool
+            Drop the partitions that turn out to hold no rows.
+        """
+        if cache is None:
+            out = super(_Frame, self).persist(**kwargs)
+        else:
+            out = cache.persist(self, **kwargs)
+        if drop_empty:
+            out = out.drop_empty_partitions()
+        return out
+
+    def compute(self, stream=False, concat="flat", **kwargs):
+        """Compute this collection.
+
+        Parameters
+        ----------
+        stream : bool
+            Return an iterator over the computed partitions instead of
+            concatenating them, see `iter_partitions`.
+        concat : {'flat', 'columns'}
+            How the partitions of a DataFrame are combined into the result.
+            'flat' concatenates all of them at once, which needs the
+            partitions and the result resident together.  'columns'
+            concatenates inside the graph one column at a time, releasing
+            the pieces of each column as soon as it is done, so the peak is
+            about the size of the result plus one column.
+        **kwargs
+            Passed on to the scheduler, or to `iter_partitions` when
+            streaming.
+        """
+        if stream:
+            return self.iter_partitions(**kwargs)
+        if concat not in ("flat", "columns"):
+            raise ValueError("concat must be 'flat' or 'columns'")
+        if concat == "columns" and isinstance(self, DataFrame):
+            return super(_Frame, self._concat_columns()).compute(**kwargs)
+        return super(_Frame, self).compute(**kwargs)
+
+    def _concat_columns(self):
+        """Single partition concatenating this frame column by column.
+
+        Partitions are first split into their columns and index, so each
+        partition is released right away and each column piece as soon as
+        its column has been concatenated.
+        """
+        if self.npartitions == 1:
+            return self
+        token = tokenize(self)
+        split = "concat-split-" + token
+        concatenated = "concat-column-" + token
+        name = "concat-columns-" + token
+        columns = list(self.columns)
+        keys = self.__dask_keys__()
+
+        dsk = {}
+        for i, key in enumerate(keys):
+            for j, col in enumerate(columns):
+                dsk[(split, i, j)] = (_column_piece, key, col)
+            dsk[(split, i, -1)] = (_index_piece, key)
+        for j in range(-1, len(columns)):
+            pieces = [(split, i, j) for i in range(len(keys))]
+            dsk[(concatenated, j)] = (cudf.concat, pieces)
+        dsk[(name, 0)] = (
+            _assemble_columns,
+            columns,
+            [(concatenated, j) for j in range(len(columns))],
+            (concatenated, -1),
+        )
+        dsk.update(self.dask)
+        divisions = [self.divisions[0], self.divisions[-1]]
+        return dd.core.new_dd_object(dsk, name, self._meta, divisions)
+
+    def iter_partitions(self, max_in_flight=2, scheduler=None, **kwargs):
+        """Compute the partitions and yield them in order.
+
+        The result is never concatenated.  The whole graph is scheduled
+        once, so tasks shared between partitions, such as those of a
+        shuffle, are computed once.  Every partition is handed over by a
+        task that returns nothing, which lets the scheduler release it
+        right away, and the tasks of a partition only start once the
+        consumer has taken the partition *max_in_flight* places before it.
+        At most *max_in_flight* computed partitions thus wait for the
+        consumer, and the following ones are computed while it works.
+        Closing the iterator early stops the computation.
+
+        The scheduler has to run in this process, either the threaded or
+        the synchronous one.
+
+        Parameters
+        ----------
+        max_in_flight : int
+            Number of computed partitions waiting to be taken at most.
+        scheduler : str or callable, optional
+            The dask scheduler to use, defaults to this collection's.
+        **kwargs
+            Passed on to the scheduler.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        schedule = dask.base.get_scheduler(scheduler=scheduler, collections=[self])
+        if schedule not in (dask.threaded.get, dask.local.get_sync):
+            raise ValueError(
+                "iter_partitions needs the threaded or the synchronous scheduler"
+            )
+        keys = self.__dask_keys__()
+        dsk = self.__dask_optimize__(self.__dask_graph__(), keys)
+        dsk, dependencies = cull(dsk, keys)
+
+        # Every task belongs to the first partition depending on it
+        owner = {}
+        for i, key in enumerate(keys):
+            stack = [key]
+            while stack:
+                k = stack.pop()
+                if k not in owner:
+                    owner[k] = i
+                    stack.extend(dependencies[k])
+
+        channel = _PartitionChannel()
+        token = tokenize(self, max_in_flight)
+        emit = "iter-emit-" + token
+        gate = "iter-gate-" + token
+        for i, key in enumerate(keys):
+            dsk[(emit, i)] = (channel.put, i, key)
+            if i >= max_in_flight:
+                # Gates run one after another, each once the partition it
+                # waits for has been handed over, so a waiting gate never
+                # holds back the partitions the consumer is waiting for
+                after = [(emit, i - max_in_flight)]
+                if i > max_in_flight:
+                    after.append((gate, i - 1))
+                dsk[(gate, i)] = (channel.wait_taken, i - max_in_flight) + tuple(after)
+        for k, i in owner.items():
+            if i >= max_in_flight and istask(dsk[k]):
+                dsk[k] = (_after, (gate, i), dsk[k])
+
+        thread = threading.Thread(
+            target=_run_stream,
+            args=(
+                schedule,
+                dsk,
+                [(emit, i) for i in range(len(keys))],
+                channel,
+                kwargs,
+            ),
+        )
+        thread.daemon = True
+        thread.start()
+        try:
+            for i in range(len(keys)):
+                yield channel.take(i)
+        finally:
+            channel.close()
+
+    def drop_empty_partitions(self, nrows=None):
+        """Drop partitions without rows, keeping the divisions consistent.
+
+        Filters, joins and binned sorts can leave many empty partitions
+        behind, each still costing a task in every later operation.
+
+        Parameters
+        ----------
+        nrows : list of int, optional
+            The number of rows of every partition, if already known.  It is
+            computed otherwise, which is cheap for persisted collections.
+        """
+        if nrows is None:
+            nrows = compute(*map(delayed(len), self.to_delayed()))
+        keep = [i for i, n in enumerate(nrows) if n]
+        if len(keep) == self.npartitions:
+            return self
+        # Keep an empty partition to hold the metadata
+        keep = keep or [0]
+
+        name = "drop-empty-" + tokenize(self, keep)
+        dsk = {(name, j): (self._name, i) for j, i in enumerate(keep)}
+        if self.known_divisions:
+            # The ranges of dropped partitions have no rows, so the preceding
+            # partition can take them over
+            divisions = [self.divisions[0]]
+            divisions += [self.divisions[i] for i in keep[1:]]
+            divisions.append(self.divisions[-1])
+        else:
+            divisions = [None] * (len(keep) + 1)
+        dsk.update(self.dask)
+        return dd.core.new_dd_object(dsk, name, self._meta, divisions)
+
+    def to_parquet(self, path, *args, **kwargs):
+        """Write one Parquet file per partition, see
+        `dask_cudf.io.parquet.to_parquet`"""
+        from dask_cudf.io import to_parquet
+
+        return to_parquet(self, path, *args, **kwargs)
+
+    def to_csv(self, path, *args, **kwargs):
+        """Write one CSV file per partition, see `dask_cudf.io.csv.to_csv`"""
+        from dask_cudf.io import to_csv
+
+        return to_csv(self, path, *args, **kwargs)
+
     def to_dask_dataframe(self):
         """Create a dask.dataframe object from a dask_cudf object"""
-        return self.map_partitions(M.to_pandas)
+        return self.map_partitions(_to_pandas)
 
     def append(self, other):
         """ Add rows from *other* """
         return concat([self, other])
 
+    def repartition(
+        self,
+        divisions=None,
+        npartitions=None,
+        partition_size=None,
+        force=False,
+        balance=False,
+    ):
+        """Repartition along new divisions, into a number of partitions or
+        into partitions of a given size.
+
+        Reducing the number of partitions coalesces neighbouring partitions
+        without computing anything, keeping known divisions.  Increasing it,
+        *balance* and *partition_size* need the row counts and sizes of the
+        current partitions, which are computed first: large partitions are
+        then split by rows and small neighbouring partitions coalesced.
+        Known divisions are kept as long as no partition has to be split.
+
+        Parameters
+        ----------
+        divisions : list, optional
+            New divisions along the index.  Requires known divisions.
+        npartitions : int, optional
+            Number of output partitions.
+        partition_size : int or str, optional
+            Maximum size in bytes of the output partitions, e.g. "256MiB".
+        force : bool
+            Allow *divisions* to extend beyond the existing divisions.
+        balance : bool
+            With *npartitions*, cut the rows into partitions of about the
+            same number of rows, even when reducing the number of
+            partitions.
+        """
+        specified = [divisions, npartitions, partition_size]
+        if sum(x is not None for x in specified) != 1:
+            raise ValueError(
+                "Exactly one of divisions, npartitions and partition_size "
+                "must be specified."
+            )
+        if divisions is not None:
+            return repartition(self, divisions, force=force)
+        if npartitions is not None and npartitions <= self.npartitions:
+            if not balance:
+                return coalesce_partitions(self, npartitions)
+
+        nrows, nbytes = _partition_sizes(self)
+        if npartitions is not None:
+            cuts = _cuts_by_npartitions(nrows, npartitions)
+        else:
+            if isinstance(partition_size, str):
+                partition_size = parse_bytes(partition_size)
+            cuts = _cuts_by_partition_size(nrows, nbytes, partition_size)
+        return repartition_rows(self, nrows, cuts)
+
 
 def _daskify(obj, npartitions=None, chunksize=None):
     """Convert input to a dask_cudf object.
@@ -126,7 +491,7 @@ def concat_indexed_dataframes(dfs):
 
     name = "concat-indexed-" + tokenize(*dfs)
 
-    parts2 = [[df for df in part] for part in parts]
+    parts2 = [[key for key in part if key is not None] for part in parts]
 
     dsk = dict(((name, i), (cudf.concat, part)) for i, part in enumerate(parts2))
     for df in dfs2:
@@ -160,6 +525,10 @@ def concat(objs, interleave_partitions=False):
 
     objs : sequence of DataFrame, Series, Index
         A sequence of objects to be concatenated.
+    interleave_partitions : bool
+        Whether inputs with known but overlapping divisions are concatenated
+        along the index.  Each input is repartitioned along the union of
+        all divisions, so the result keeps known divisions.
     """
     dfs = [_daskify(x) for x in objs]
 
@@ -176,8 +545,14 @@ def concat(objs, interleave_partitions=False):
                 divisions += df.divisions[:-1]
             divisions += dfs[-1].divisions
             return stack_partitions(dfs, divisions)
-    elif interleave_partitions:
-        return concat_indexed_dataframes(dfs)
+        elif interleave_partitions:
+            return concat_indexed_dataframes(dfs)
+        else:
+            raise ValueError(
+                "All inputs have known divisions which cannot be "
+                "concatenated in order. Specify "
+                "interleave_partitions=True to ignore order"
+            )
     else:
         divisions = [None] * (sum([df.npartitions for df in dfs]) + 1)
         return stack_partitions(dfs, divisions)
@@ -244,15 +619,58 @@ class DataFrame(_Frame, dd.core.DataFrame):
         callenv = {"locals": {}, "globals": {}}
         return self.map_partitions(query, expr, callenv, meta=self._meta)
 
-    def merge(self, other, on=None, how="left", lsuffix="_x", rsuffix="_y"):
+    def nlargest(self, n=5, columns=None, split_every=None, prune=False):
+        """The *n* rows with the largest values in *columns*, as a tree
+        reduction.
+
+        Parameters
+        ----------
+        n : int
+        columns : str or list[str]
+            Column(s) to order by.
+        split_every : int, optional
+            Group size of the tree reduction.
+        prune : bool
+            Compute statistics of the first column per partition first and
+            skip the partitions that cannot contain any of the result.
+        """
+        return _top_k(self, n, columns, True, split_every, prune)
+
+    def nsmallest(self, n=5, columns=None, split_every=None, prune=False):
+        """The *n* rows with the smallest values in *columns*, see
+        `nlargest`"""
+        return _top_k(self, n, columns, False, split_every, prune)
+
+    def merge(
+        self,
+        other,
+        on=None,
+        how="left",
+        lsuffix="_x",
+        rsuffix="_y",
+        skew_threshold=None,
+        sample_size=1000,
+    ):
         """Merging two dataframes on the column(s) indicated in *on*.
+
+        With *skew_threshold*, keys of this frame holding more than
+        *skew_threshold* times the rows of an average output partition are
+        detected from *sample_size* sampled rows per partition and spread
+        over several output partitions.
         """
         assert how == "left", "left join is impelemented"
         if on is None:
             return self.join(other, how=how, lsuffix=lsuffix, rsuffix=rsuffix)
         else:
             return join_impl.join_frames(
-                left=self, right=other, on=on, how=how, lsuffix=lsuffix, rsuffix=rsuffix
+                left=self,
+                right=other,
+                on=on,
+                how=how,
+                lsuffix=lsuffix,
+                rsuffix=rsuffix,
+                skew_threshold=skew_threshold,
+                sample_size=sample_size,
             )
 
     def join(self, other, how="left", lsuffix="", rsuffix=""):
@@ -313,15 +731,7 @@ class DataFrame(_Frame, dd.core.DataFrame):
                 df[k + lsuffix] = lhs[k]
 
             for k, dtype in rhs_dtypes:
-                data = np.zeros(len(lhs), dtype=dtype)
-                mask_size = cudf.utils.calc_chunk_size(
-                    data.size, cudf.utils.mask_bitsize
-                )
-                mask = np.zeros(mask_size, dtype=cudf.utils.mask_dtype)
-                sr = cudf.Series.from_masked_array(
-                    data=data, mask=mask, null_count=data.size
-                )
-
+                sr = null_column(len(lhs), dtype)
                 df[k + rsuffix] = sr.set_index(df.index)
 
             return df
@@ -521,15 +931,22 @@ class DataFrame(_Frame, dd.core.DataFrame):
 
             return self.map_partitions(reset_index, meta=reset_index(self._meta))
 
-    def sort_values(self, by, ignore_index=False):
-        """Sort by the given column
+    def sort_values(self, by, ignore_index=False, ascending=True, na_position="last"):
+        """Sort by the given column(s)
 
         Parameter
         ---------
-        by : str
+        by : str or list[str]
+            Column(s) to sort by, compared lexicographically
+        ascending : bool or list[bool]
+            Sort direction, for all keys or for each key of *by*
+        na_position : {'last', 'first'}
+            Where to put the nulls of each key
         """
         parts = self.to_delayed()
-        sorted_parts = batcher_sortnet.sort_delayed_frame(parts, by)
+        sorted_parts = batcher_sortnet.sort_delayed_frame(
+            parts, by, ascending=ascending, na_position=na_position
+        )
         return from_delayed(sorted_parts, meta=self._meta).reset_index(
             force=not ignore_index
         )
@@ -624,6 +1041,79 @@ def unique_k_agg(x, **kwargs):
     return cudf.concat(x).unique_k(**kwargs)
 
 
+def _summary_quantiles(summary, q, name):
+    out = sketches.summary_quantiles(summary, q)
+    if pd.api.types.is_list_like(q):
+        out = cudf.Series(out, index=list(q))
+        out.name = name
+        return out
+    return float(out)
+
+
+def _min_max_count(x):
+    n = x.count()
+    return (x.min(), x.max(), n) if n else (None, None, 0)
+
+
+def _prune_top_k(df, n, columns, largest):
+    """Drop the partitions of *df* that cannot hold any of the top *n* rows.
+
+    Computes the min, max and count of the first sort key per partition.
+    Visiting partitions from the best bound down, once *n* values are known
+    to be at least as good as a threshold, any partition whose best value is
+    worse than that threshold is skipped.
+    """
+    if columns is None:
+        key = df
+    else:
+        key = df[columns if isinstance(columns, str) else columns[0]]
+    stats = compute(*map(delayed(_min_max_count), key.to_delayed()))
+    stats = [(i, lo, hi, k) for i, (lo, hi, k) in enumerate(stats) if k]
+
+    bound, best = (1, 2) if largest else (2, 1)
+    stats_order = sorted(stats, key=lambda s: s[bound], reverse=largest)
+    threshold = None
+    total = 0
+    for s in stats_order:
+        total += s[3]
+        if total >= n:
+            threshold = s[bound]
+            break
+
+    if threshold is None:
+        keep = [s[0] for s in stats]
+    elif largest:
+        keep = [s[0] for s in stats if s[best] >= threshold]
+    else:
+        keep = [s[0] for s in stats if s[best] <= threshold]
+    if len(keep) == df.npartitions:
+        return df
+    keep = keep or [0]
+
+    name = "prune-top-k-" + tokenize(df, keep)
+    dsk = {(name, j): (df._name, i) for j, i in enumerate(keep)}
+    dsk.update(df.dask)
+    return dd.core.new_dd_object(dsk, name, df._meta, [None] * (len(keep) + 1))
+
+
+def _top_k(df, n, columns, largest, split_every, prune):
+    """Tree reduction keeping the *n* largest or smallest rows per chunk"""
+    if prune and df.npartitions > 1:
+        df = _prune_top_k(df, n, columns, largest)
+    kwargs = {"n": n}
+    if columns is not None:
+        kwargs["columns"] = columns
+    return reduction(
+        df,
+        chunk=M.nlargest if largest else M.nsmallest,
+        aggregate=nlargest_agg if largest else nsmallest_agg,
+        meta=df._meta,
+        token="nlargest" if largest else "nsmallest",
+        split_every=split_every,
+        **kwargs
+    )
+
+
 class Series(_Frame, dd.core.Series):
     _partition_type = cudf.Series
 
@@ -637,6 +1127,105 @@ class Series(_Frame, dd.core.Series):
         n = self.count(split_every=split_every)
         return sum / n
 
+    def nlargest(self, n=5, split_every=None, prune=False):
+        """The *n* largest values, as a tree reduction.
+
+        Parameters
+        ----------
+        n : int
+        split_every : int, optional
+            Group size of the tree reduction.
+        prune : bool
+            Compute per-partition statistics first and skip the partitions
+            that cannot contain any of the result.  Most useful on persisted
+            collections.
+        """
+        return _top_k(self, n, None, True, split_every, prune)
+
+    def nsmallest(self, n=5, split_every=None, prune=False):
+        """The *n* smallest values, see `nlargest`"""
+        return _top_k(self, n, None, False, split_every, prune)
+
+    def nunique_approx(self, relative_error=0.01, split_every=None):
+        """Approximate number of distinct values, ignoring nulls.
+
+        Every partition is summarized by a HyperLogLog sketch of
+        ``2 ** p`` one-byte registers, merged in a tree reduction, so memory
+        does not grow with the number of rows or distinct values.
+
+        Parameters
+        ----------
+        relative_error : float
+            Standard error of the estimate, e.g. 0.01 for 1%.
+        split_every : int, optional
+            Group size of the tree reduction.
+        """
+        precision = sketches.hll_precision(relative_error)
+        return reduction(
+            self,
+            chunk=sketches.hll_sketch,
+            combine=sketches.hll_merge,
+            aggregate=sketches.hll_aggregate,
+            chunk_kwargs={"precision": precision},
+            meta="i8",
+            token="nunique-approx",
+            split_every=split_every,
+        )
+
+    def quantile_summary(self, size=1000, split_every=None):
+        """Mergeable summary of the distribution of the values, ignoring
+        nulls.
+
+        Every partition is sorted and sampled down to *size* evenly ranked
+        points, and summaries are merged in a tree reduction.  The result
+        answers quantile queries with `dask_cudf.sketches.summary_quantiles`
+        and yields range-partitioning boundaries with
+        `dask_cudf.sketches.summary_splitters`, so one pass over the data
+        serves both.
+
+        Parameters
+        ----------
+        size : int
+            Number of points kept, the rank error is about ``1 / size`` per
+            level of the reduction tree.
+        split_every : int, optional
+            Group size of the tree reduction.
+        """
+        return reduction(
+            self,
+            chunk=sketches.quantile_summary,
+            aggregate=sketches.summary_merge,
+            meta="O",
+            token="quantile-summary",
+            split_every=split_every,
+            size=size,
+        )
+
+    def quantile(self, q=0.5, method="default", size=1000, split_every=None):
+        """Approximate quantiles of the values.
+
+        Parameters
+        ----------
+        q : float or list[float]
+            Quantile(s) between 0 and 1.
+        method : {'default', 'sketch'}
+            'sketch' computes the quantiles from `quantile_summary`, other
+            methods fall back to dask.dataframe.
+        size, split_every :
+            See `quantile_summary`.
+        """
+        if method != "sketch":
+            return super(Series, self).quantile(q, method=method)
+
+        summary = self.quantile_summary(size=size, split_every=split_every)
+        name = "quantile-" + tokenize(summary, q)
+        dsk = {(name, 0): (_summary_quantiles, summary.key, q, self.name)}
+        dsk.update(summary.dask)
+        if pd.api.types.is_list_like(q):
+            meta = make_meta((self.name, "f8"))
+            return dd.core.new_dd_object(dsk, name, meta, (None, None))
+        return Scalar(dsk, name, make_meta("f8"))
+
     def unique_k(self, k, split_every=None):
         return reduction(
             self,
@@ -659,29 +1248,126 @@ class Index(Series, dd.core.Index):
     _partition_type = cudf.dataframe.index.Index
 
 
+def _searchsorted(values, value, side="left"):
+    """Position at which *value* would be inserted into the sorted cudf
+    Series *values*.
+
+    The position is counted on the device, so only the result leaves it.
+    """
+    if side == "left":
+        mask = values < value
+    else:
+        mask = values <= value
+    return int(mask.astype(np.int64).sum())
+
+
+@cuda.jit
+def _run_bounds_kernel(values, targets, lefts, rights):
+    i = cuda.grid(1)
+    if i < targets.size:
+        pivot = values[targets[i]]
+        # Binary search for the first value equal to the pivot ...
+        lo, hi = 0, targets[i]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if values[mid] < pivot:
+                lo = mid + 1
+            else:
+                hi = mid
+        lefts[i] = lo
+        # ... and for the first value past it
+        lo, hi = targets[i] + 1, values.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if values[mid] <= pivot:
+                lo = mid + 1
+            else:
+                hi = mid
+        rights[i] = lo
+
+
+def _run_bounds(values, targets):
+    """Start and end of the run of equal values containing each of the
+    *targets* positions of the sorted device array *values*.
+
+    All runs are found by a single kernel launch, one binary search per
+    target, so only the bounds leave the device.
+    """
+    if values.dtype.kind == "M":
+        values = values.view(np.int64)
+    n = len(targets)
+    lefts = cuda.device_array(n, dtype=np.int64)
+    rights = cuda.device_array(n, dtype=np.int64)
+    if n:
+        nthreads = 256
+        _run_bounds_kernel[ceil(n / nthreads), nthreads](
+            values, cuda.to_device(targets.astype(np.int64)), lefts, rights
+        )
+    return lefts.copy_to_host(), rights.copy_to_host()
+
+
+def _split_targets(nrows, chunksize):
+    return np.arange(chunksize, nrows - 1, chunksize)
+
+
+def _snap_splits(nrows, targets, lefts, rights):
+    """Move every target split position to the start of a run of equal
+    index values, given where each run containing a target starts (*lefts*)
+    and ends (*rights*).  Returns the inclusive split positions, starting at
+    0 and ending with the last row.
+    """
+    points = np.where(lefts == targets, targets, rights)
+    points = points[(points > 0) & (points < nrows - 1)]
+    return [0] + sorted(set(points.tolist())) + [nrows - 1]
+
+
+def splits_divisions_sorted_numpy(values, chunksize):
+    """NumPy reference implementation of ``splits_divisions_sorted_cudf``
+
+    Parameters
+    ----------
+    values : array-like
+        The sorted index values
+    chunksize : int
+        The number of rows per partition to aim for
+    """
+    values = np.asarray(values)
+    nrows = len(values)
+    targets = _split_targets(nrows, chunksize)
+    pivots = values[targets]
+    splits = _snap_splits(
+        nrows,
+        targets,
+        np.searchsorted(values, pivots, side="left"),
+        np.searchsorted(values, pivots, side="right"),
+    )
+    divisions = tuple(values[np.array(splits)])
+    splits[-1] += 1  # Offset to extract to end
+
+    return splits, divisions
+
+
 def splits_divisions_sorted_cudf(df, chunksize):
-    segments = list(df.index.find_segments().to_array())
-    segments.append(len(df) - 1)
-
-    splits = [0]
-    last = current_size = 0
-    for s in segments:
-        size = s - last
-        last = s
-        current_size += size
-        if current_size >= chunksize:
-            splits.append(s)
-            current_size = 0
-    # Ensure end is included
-    if splits[-1] != segments[-1]:
-        splits.append(segments[-1])
+    """Choose partition boundaries of about *chunksize* rows for *df*, whose
+    index is sorted, so that equal index values never straddle partitions.
+
+    Split positions are placed every *chunksize* rows and moved forward to
+    the start of the next run of equal values when they land inside one.
+    The runs around all split positions are found in one kernel launch and
+    only their boundaries are brought to the host.
+    """
+    nrows = len(df)
+    targets = _split_targets(nrows, chunksize)
+    values = cudf.Series(df.index.as_column()).to_gpu_array()
+    lefts, rights = _run_bounds(values, targets)
+    splits = _snap_splits(nrows, targets, lefts, rights)
     divisions = tuple(df.index.take(np.array(splits)).values)
     splits[-1] += 1  # Offset to extract to end
 
     return splits, divisions
 
 
-def from_cudf(data, npartitions=None, chunksize=None, sort=True, name=None):
+def from_cudf(data, npartitions=None, chunksize=None, sort=True, name=None, copy=True):
     """Create a dask_cudf from a cudf object
 
     Parameters
@@ -695,9 +1381,14 @@ def from_cudf(data, npartitions=None, chunksize=None, sort=True, name=None):
         The number of rows per index partition to use.
     sort : bool
         Sort input first to obtain cleanly divided partitions or don't sort and
-        don't get cleanly divided partitions
+        don't get cleanly divided partitions.  Input whose index is already
+        monotonic increasing is not sorted again.
     name : string, optional
         An optional keyname for the dataframe. Defaults to a uuid.
+    copy : bool
+        Whether to slice the partitions out of *data* up front.  If False,
+        the graph holds a single reference to *data* and each partition is
+        sliced from it by row offsets when it is computed.
 
     Returns
     -------
@@ -720,40 +1411,111 @@ def from_cudf(data, npartitions=None, chunksize=None, sort=True, name=None):
     name = name or ("from_cudf-" + uuid4().hex)
 
     if sort:
-        data = data.sort_index(ascending=True)
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index(ascending=True)
         splits, divisions = splits_divisions_sorted_cudf(data, chunksize)
     else:
         splits = list(range(0, nrows, chunksize)) + [len(data)]
         divisions = (None,) * len(splits)
 
-    dsk = {
-        (name, i): data[start:stop]
-        for i, (start, stop) in enumerate(zip(splits[:-1], splits[1:]))
-    }
+    bounds = list(zip(splits[:-1], splits[1:]))
+
+    if copy:
+        dsk = {(name, i): data[start:stop] for i, (start, stop) in enumerate(bounds)}
+    else:
+        source = "source-" + name
+        dsk = {
+            (name, i): (operator.getitem, source, slice(start, stop))
+            for i, (start, stop) in enumerate(bounds)
+        }
+        dsk[source] = data
 
     return dd.core.new_dd_object(dsk, name, data, divisions)
 
 
 def _from_pandas(df):
-    return cudf.DataFrame.from_pandas(df)
+    """Convert a pandas DataFrame to cudf through an Arrow table.
+
+    Arrow hands each column over as contiguous buffers, strings as one
+    offsets and one characters buffer and categoricals as dictionaries,
+    instead of converting the frame column by column.
+    """
+    return cudf.DataFrame.from_arrow(pa.Table.from_pandas(df, preserve_index=True))
+
+
+def _to_pandas(df):
+    """Convert a cudf object to pandas, going through Arrow for DataFrames"""
+    if isinstance(df, cudf.DataFrame):
+        return df.to_arrow().to_pandas()
+    return df.to_pandas()
 
 
 def from_dask_dataframe(df):
     """Create a `dask_cudf.DataFrame` from a `dask.dataframe.DataFrame`
 
+    Partitions are converted through Arrow tables.
+
     Parameters
     ----------
     df : dask.dataframe.DataFrame
     """
-    bad_cols = df.select_dtypes(include=["O"])
-    if len(bad_cols.columns):
-        raise ValueError("Object dtypes aren't supported by cudf")
-
-    meta = _from_pandas(df._meta)
+    # Arrow cannot infer the type of an empty object column
+    meta = _from_pandas(dd.utils.meta_nonempty(df._meta))
     dummy = DataFrame(df.dask, df._name, meta, df.divisions)
     return dummy.map_partitions(_from_pandas, meta=meta)
 
 
+def from_delayed(dfs, meta=None, divisions=None, prefix="from-delayed"):
+    """Create a dask_cudf object from many Dask Delayed objects
+
+    Every partition is checked against *meta*.  Instead of a copy of the
+    meta object, each task carries the interned ``Schema`` of *meta*, which
+    keeps graphs with many partitions small when they are serialized.
+
+    Parameters
+    ----------
+    dfs : list of Delayed
+        The partitions of the resulting dataframe.
+    meta : cudf.DataFrame or cudf.Series, optional
+        An empty cudf object matching the partitions.  Computed from the
+        first partition if not provided.
+    divisions : tuple, optional
+        Partition boundaries along the index.  Unknown if not provided.
+    prefix : str, optional
+        Prefix to prepend to the keys.
+    """
+    if isinstance(dfs, Delayed):
+        dfs = [dfs]
+    dfs = [
+        delayed(df) if not isinstance(df, Delayed) and hasattr(df, "key") else df
+        for df in dfs
+    ]
+    for df in dfs:
+        if not isinstance(df, Delayed):
+            raise TypeError("Expected Delayed object, got %s" % type(df).__name__)
+
+    if meta is None:
+        meta = dfs[0].compute()
+    meta = make_meta(meta)
+    schema = Schema.of(meta)
+
+    name = prefix + "-" + tokenize(*dfs)
+    dsk = {}
+    for i, df in enumerate(dfs):
+        dsk.update(df.dask)
+        if schema is None:
+            dsk[(name, i)] = (dd.utils.check_meta, df.key, meta, "from_delayed")
+        else:
+            dsk[(name, i)] = (check_schema, df.key, schema, "from_delayed")
+
+    if divisions is None:
+        divisions = [None] * (len(dfs) + 1)
+    elif len(divisions) != len(dfs) + 1:
+        raise ValueError("divisions should be a tuple of len(dfs) + 1")
+
+    return dd.core.new_dd_object(dsk, name, meta, divisions)
+
+
 def _extract_meta(x):
     """
     Extract internal cache data (``_meta``) from dask_cudf objects
@@ -778,19 +1540,201 @@ def _emulate(func, *args, **kwargs):
         return func(*_extract_meta(args), **_extract_meta(kwargs))
 
 
-def align_partitions(args):
-    """Align partitions between dask_cudf objects.
+def boundary_slice(df, start, stop, right_boundary=True, left_boundary=True):
+    """Slice a cudf object with a sorted index between two index values.
+
+    Parameters
+    ----------
+    df : cudf.DataFrame or cudf.Series
+    start, stop : index values or None
+        The bounds of the slice.  None leaves that side unbounded.
+    right_boundary, left_boundary : bool
+        Whether rows equal to *stop* and *start* are included.
+    """
+    if len(df) == 0:
+        return df
+    index = cudf.Series(df.index.as_column())
+    lo, hi = 0, len(df)
+    if start is not None:
+        lo = _searchsorted(index, start, side="left" if left_boundary else "right")
+    if stop is not None:
+        hi = _searchsorted(index, stop, side="right" if right_boundary else "left")
+    return df[lo : max(lo, hi)]
+
+
+def repartition(df, divisions, force=False):
+    """Repartition a dask_cudf object along new divisions.
+
+    Partitions are sliced at the new boundaries with ``boundary_slice`` and
+    the slices falling into the same new partition are concatenated.
+
+    Parameters
+    ----------
+    df : DataFrame or Series
+        Must have known divisions
+    divisions : list
+        The new divisions
+    force : bool
+        Allow the new divisions to extend beyond the existing ones.
+    """
+    token = tokenize(df, divisions)
+    out1 = "repartition-split-" + token
+    out2 = "repartition-merge-" + token
+    dsk = dd.core.repartition_divisions(
+        df.divisions, divisions, df._name, out1, out2, force=force
+    )
+    # Swap in the cudf implementations of dask's pandas slicing and concat
+    replace = {methods.boundary_slice: boundary_slice, methods.concat: cudf.concat}
+    dsk = {k: (replace.get(v[0], v[0]),) + v[1:] for k, v in dsk.items()}
+    dsk.update(df.dask)
+    return dd.core.new_dd_object(dsk, out2, df._meta, divisions)
+
+
+def _len_and_sizeof(df):
+    return len(df), sizeof(df)
+
 
-    Note that if all divisions are unknown, but have equal npartitions, then
-    they will be passed through unchanged."""
-    dfs = [df for df in args if isinstance(df, _Frame)]
-    if not dfs:
-        return args
+def _partition_sizes(df):
+    """Compute the number of rows and bytes of every partition of *df*"""
+    sizes = compute(*map(delayed(_len_and_sizeof), df.to_delayed()))
+    nrows, nbytes = zip(*sizes)
+    return list(nrows), list(nbytes)
+
+
+def _cuts_by_npartitions(nrows, npartitions):
+    """Row positions cutting *nrows* rows into *npartitions* even parts"""
+    total = sum(nrows)
+    cuts = np.linspace(0, total, min(npartitions, max(total, 1)) + 1)
+    return np.unique(np.round(cuts).astype(np.int64)).tolist()
+
+
+def _cuts_by_partition_size(nrows, nbytes, partition_size):
+    """Row positions regrouping partitions into parts of at most
+    *partition_size* bytes.
+
+    Neighbouring partitions are grouped while they fit together and larger
+    partitions are cut into equal parts, assuming that their bytes are
+    evenly spread over their rows.
+    """
+    cuts = [0]
+    offset = group = 0
+    for n, b in zip(nrows, nbytes):
+        if b > partition_size:
+            if group:
+                cuts.append(offset)
+            k = min(int(ceil(b / partition_size)), max(n, 1))
+            cuts.extend(offset + int(round(j * n / k)) for j in range(1, k + 1))
+            group = 0
+        elif group + b > partition_size:
+            cuts.append(offset)
+            group = b
+        else:
+            group += b
+        offset += n
+    cuts.append(offset)
+    return sorted(set(cuts))
+
+
+def coalesce_partitions(df, npartitions):
+    """Concatenate groups of neighbouring partitions of *df* into
+    *npartitions* partitions, without computing anything"""
+    if npartitions < 1:
+        raise ValueError("npartitions must be at least 1")
+    if npartitions >= df.npartitions:
+        return df
+    bounds = np.linspace(0, df.npartitions, npartitions + 1).astype(np.int64)
+    bounds = np.unique(bounds).tolist()
+    name = "coalesce-" + tokenize(df, npartitions)
+    dsk = {}
+    for j, (lo, hi) in enumerate(zip(bounds[:-1], bounds[1:])):
+        keys = [(df._name, i) for i in range(lo, hi)]
+        dsk[(name, j)] = keys[0] if len(keys) == 1 else (cudf.concat, keys)
+    divisions = [df.divisions[b] for b in bounds]
+    dsk.update(df.dask)
+    return dd.core.new_dd_object(dsk, name, df._meta, divisions)
+
+
+def repartition_rows(df, nrows, cuts):
+    """Repartition *df* at global row positions.
+
+    Parameters
+    ----------
+    df : DataFrame or Series
+    nrows : list of int
+        The number of rows of every partition of *df*
+    cuts : list of int
+        Sorted row positions of the new partition boundaries, starting at 0
+        and ending with the total number of rows
+    """
+    offsets = np.concatenate([[0], np.cumsum(nrows)]).astype(np.int64).tolist()
+    if cuts == offsets:
+        return df
+
+    name = "repartition-rows-" + tokenize(df, cuts)
+    dsk = {}
+    for j, (start, stop) in enumerate(zip(cuts[:-1], cuts[1:])):
+        pieces = []
+        for i, (lo, hi) in enumerate(zip(offsets[:-1], offsets[1:])):
+            a, b = max(start, lo), min(stop, hi)
+            if a >= b:
+                continue
+            if (a, b) == (lo, hi):
+                pieces.append((df._name, i))
+            else:
+                pieces.append((operator.getitem, (df._name, i), slice(a - lo, b - lo)))
+        dsk[(name, j)] = pieces[0] if len(pieces) == 1 else (cudf.concat, pieces)
+    if len(cuts) < 2:
+        dsk[(name, 0)] = (df._name, 0)
+        cuts = [0, 0]
+
+    if df.known_divisions and set(cuts) <= set(offsets):
+        divisions = [df.divisions[offsets.index(c)] for c in cuts[:-1]]
+        divisions.append(df.divisions[-1])
+    else:
+        divisions = [None] * len(cuts)
+    dsk.update(df.dask)
+    return dd.core.new_dd_object(dsk, name, df._meta, divisions)
+
+
+def align_partitions(*dfs):
+    """Mutually partition and align dask_cudf objects along their index.
+
+    Every input is repartitioned along the union of all divisions.
+
+    Returns
+    -------
+    dfs : list of DataFrame or Series
+        The repartitioned inputs, all with the same divisions
+    divisions : tuple
+        The divisions of the inputs
+    parts : list of lists
+        For every partition, the key of each input holding data for it, or
+        None where an input has no partition there
+    """
+    if not all(df.known_divisions for df in dfs):
+        raise ValueError(
+            "Not all divisions are known, can't align partitions. "
+            "Please use `set_index` to set the index."
+        )
 
-    divisions = dfs[0].divisions
-    if not all(df.divisions == divisions for df in dfs):
-        raise NotImplementedError("Aligning mismatched partitions")
-    return args
+    divisions = list(unique(merge_sorted(*[df.divisions for df in dfs])))
+    if len(divisions) == 1:  # single value for index
+        divisions = [divisions[0], divisions[0]]
+    dfs2 = [repartition(df, divisions, force=True) for df in dfs]
+
+    parts = []
+    inds = [0] * len(dfs2)
+    for d in divisions[:-1]:
+        part = []
+        for i, df in enumerate(dfs2):
+            j = inds[i]
+            if j < df.npartitions and df.divisions[j] == d:
+                part.append((df._name, j))
+                inds[i] += 1
+            else:
+                part.append(None)
+        parts.append(part)
+    return dfs2, tuple(divisions), parts
 
 
 def reduction(
@@ -0,0 +1,309 @@
+"""
+Tools to inspect the cost of dask_cudf computations.
+"""
+import json
+from collections import Counter, namedtuple
+from timeit import default_timer
+
+import pandas as pd
+from dask.callbacks import Callback
+from dask.core import flatten, get_dependencies, get_deps, istask, toposort
+from dask.order import order
+from dask.sizeof import sizeof
+from dask.utils import key_split
+
+import cudf
+
+GraphStats = namedtuple("GraphStats", ["ntasks", "depth", "width", "layers"])
+
+
+def graph_stats(collection, optimize=False):
+    """Report the size and shape of the task graph of *collection*.
+
+    Parameters
+    ----------
+    collection : dask collection
+        E.g. a dask_cudf DataFrame, Series or a Delayed object.
+    optimize : bool
+        Inspect the graph after culling and fusion, as it would be
+        scheduled, instead of the raw graph.
+
+    Returns
+    -------
+    stats : GraphStats
+        ``ntasks`` is the number of tasks, ``depth`` the number of tasks on
+        the longest dependency chain (the critical path) and ``width`` the
+        largest number of tasks at the same depth.  ``layers`` counts the
+        tasks per key prefix, e.g. ``{"from_cudf": 4, "unique-k-agg": 1}``.
+
+    Examples
+    --------
+    >>> graph_stats(ddf.sort_values("x"))  # doctest: +SKIP
+    GraphStats(ntasks=60, depth=10, width=8, layers=Counter({...}))
+    """
+    dsk = dict(collection.__dask_graph__())
+    if optimize:
+        dsk = collection.__dask_optimize__(dsk, collection.__dask_keys__())
+        dsk = dict(dsk)
+    dependencies = {k: get_dependencies(dsk, k) for k in dsk}
+
+    levels = {}
+    for key in toposort(dsk, dependencies=dependencies):
+        deps = dependencies[key]
+        levels[key] = 1 + max([levels[d] for d in deps]) if deps else 1
+
+    width = max(Counter(levels.values()).values()) if levels else 0
+    return GraphStats(
+        ntasks=len(dsk),
+        depth=max(levels.values()) if levels else 0,
+        width=width,
+        layers=Counter(map(key_split, dsk)),
+    )
+
+
+TaskRecord = namedtuple(
+    "TaskRecord",
+    [
+        "key",
+        "layer",
+        "start",
+        "host_end",
+        "end",
+        "worker_id",
+        "rows_in",
+        "bytes_in",
+        "rows_out",
+        "bytes_out",
+    ],
+)
+
+_frame_types = (cudf.DataFrame, cudf.Series, pd.DataFrame, pd.Series)
+
+
+def _nrows(x):
+    if isinstance(x, _frame_types):
+        return len(x)
+    if isinstance(x, (list, tuple)):
+        return sum(map(_nrows, x))
+    return 0
+
+
+class Profiler(Callback):
+    """Record the time, rows and bytes of every task of a computation.
+
+    Each record is tagged with the graph layer the task belongs to, the
+    key prefix such as ``_compare_frame`` or ``local_shuffle``.
+
+    Parameters
+    ----------
+    synchronize : bool
+        Wait for the device after every task.  Kernels launched by a task
+        are then charged to it: ``host_end`` is when the task returned and
+        ``end`` is when the device became idle.
+
+    Examples
+    --------
+    >>> with Profiler() as prof:  # doctest: +SKIP
+    ...     ddf.sort_values("x").compute()
+    >>> prof.summary()  # doctest: +SKIP
+    >>> prof.to_chrome_trace("sort.json")  # doctest: +SKIP
+    """
+
+    def __init__(self, synchronize=False):
+        super(Profiler, self).__init__()
+        self.synchronize = synchronize
+        self.results = []
+        self._pending = {}
+
+    def __enter__(self):
+        self.clear()
+        return super(Profiler, self).__enter__()
+
+    def clear(self):
+        self.results = []
+        self._pending = {}
+
+    def _pretask(self, key, dsk, state):
+        deps = state["dependencies"].get(key, ())
+        inputs = [state["cache"][d] for d in deps if d in state["cache"]]
+        nbytes = sizeof(inputs) if inputs else 0
+        self._pending[key] = (default_timer(), _nrows(inputs), nbytes)
+
+    def _posttask(self, key, value, dsk, state, worker_id):
+        host_end = default_timer()
+        if self.synchronize:
+            from numba import cuda
+
+            cuda.synchronize()
+        end = default_timer()
+        start, rows_in, bytes_in = self._pending.pop(key)
+        self.results.append(
+            TaskRecord(
+                key=key,
+                layer=key_split(key),
+                start=start,
+                host_end=host_end,
+                end=end,
+                worker_id=worker_id,
+                rows_in=rows_in,
+                bytes_in=bytes_in,
+                rows_out=_nrows(value),
+                bytes_out=sizeof(value),
+            )
+        )
+
+    def to_table(self):
+        """All records as a pandas DataFrame, one row per task"""
+        df = pd.DataFrame(self.results, columns=TaskRecord._fields)
+        df["duration"] = df["end"] - df["start"]
+        df["device_wait"] = df["end"] - df["host_end"]
+        return df
+
+    def summary(self):
+        """Number of tasks, total time, rows and bytes per graph layer,
+        most expensive first"""
+        df = self.to_table()
+        columns = ["duration", "device_wait", "rows_in", "rows_out"]
+        columns += ["bytes_in", "bytes_out"]
+        out = df.groupby("layer")[columns].sum()
+        out.insert(0, "ntasks", df.groupby("layer").size())
+        return out.sort_values("duration", ascending=False)
+
+    def to_chrome_trace(self, path=None):
+        """Export the records in the Chrome trace event format.
+
+        Open the result in ``chrome://tracing`` or Perfetto.  The trace is
+        written to *path* if given and returned as a dict.
+        """
+        origin = min([r.start for r in self.results], default=0)
+        events = []
+        for r in self.results:
+            events.append(
+                {
+                    "name": r.layer,
+                    "cat": "task",
+                    "ph": "X",
+                    "ts": (r.start - origin) * 1e6,
+                    "dur": (r.end - r.start) * 1e6,
+                    "pid": 0,
+                    "tid": r.worker_id,
+                    "args": {
+                        "key": str(r.key),
+                        "rows_in": r.rows_in,
+                        "rows_out": r.rows_out,
+                        "bytes_in": r.bytes_in,
+                        "bytes_out": r.bytes_out,
+                        "device_wait": r.end - r.host_end,
+                    },
+                }
+            )
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if path is not None:
+            with open(path, "w") as f:
+                json.dump(trace, f)
+        return trace
+
+
+class MemoryTracker(Callback):
+    """Track the resident size of task results during a computation.
+
+    After every task, the results held by the scheduler plus the inputs the
+    task just released are considered resident, as they were all alive
+    while it ran.  Sizes come from dask's ``sizeof``.
+
+    Attributes
+    ----------
+    peak : int
+        Largest resident size in bytes.
+    peak_keys : list
+        The keys alive at the peak, largest first.
+    timeline : list of (key, int)
+        The resident size after each task.
+
+    Examples
+    --------
+    >>> with MemoryTracker() as mem:  # doctest: +SKIP
+    ...     ddf.merge(other, on=("id",)).persist()
+    >>> mem.peak, mem.peak_keys[:3]  # doctest: +SKIP
+    """
+
+    def __init__(self):
+        super(MemoryTracker, self).__init__()
+        self.clear()
+
+    def __enter__(self):
+        self.clear()
+        return super(MemoryTracker, self).__enter__()
+
+    def clear(self):
+        self.peak = 0
+        self.peak_keys = []
+        self.timeline = []
+        self._sizes = {}
+
+    def _start_state(self, dsk, state):
+        for key, value in state["cache"].items():
+            self._sizes[key] = sizeof(value)
+
+    def _posttask(self, key, value, dsk, state, worker_id):
+        self._sizes[key] = sizeof(value)
+        alive = set(state["cache"]) | state["dependencies"].get(key, set())
+        alive.add(key)
+        resident = sum(self._sizes.get(k, 0) for k in alive)
+        self.timeline.append((key, resident))
+        if resident > self.peak:
+            self.peak = resident
+            self.peak_keys = sorted(alive, key=lambda k: -self._sizes.get(k, 0))
+
+
+MemoryEstimate = namedtuple("MemoryEstimate", ["peak", "peak_keys", "nbytes"])
+
+
+def estimate_peak_memory(collection, nbytes=None):
+    """Predict the peak resident size of computing *collection*.
+
+    Tasks are replayed one at a time in the order of ``dask.order``.
+    Results are released as soon as their last dependent ran.
+
+    Parameters
+    ----------
+    collection : dask collection
+    nbytes : dict, optional
+        Known sizes in bytes of some keys, typically of the input partitions,
+        e.g. from ``sizeof`` of persisted partitions.  Keys holding data in
+        the graph are measured directly.  Any other task is assumed to be as
+        large as its inputs together.
+
+    Returns
+    -------
+    estimate : MemoryEstimate
+        The estimated ``peak`` in bytes, the keys alive at the peak and the
+        estimated size of every key.
+    """
+    dsk = dict(collection.__dask_graph__())
+    outputs = set(flatten(collection.__dask_keys__()))
+    dependencies, dependents = get_deps(dsk)
+    sizes = dict(nbytes or {})
+    remaining = {k: len(v) for k, v in dependents.items()}
+
+    alive = set()
+    peak, peak_keys = 0, []
+    priorities = order(dsk, dependencies=dependencies)
+    for key in sorted(dsk, key=priorities.get):
+        if key not in sizes:
+            if dependencies[key]:
+                sizes[key] = sum(sizes[d] for d in dependencies[key])
+            elif istask(dsk[key]):
+                # A task without inputs, e.g. reading a file, is unknown
+                sizes[key] = 0
+            else:
+                sizes[key] = sizeof(dsk[key])
+        alive.add(key)
+        resident = sum(sizes[k] for k in alive)
+        if resident > peak:
+            peak, peak_keys = resident, sorted(alive, key=lambda k: -sizes[k])
+        for dep in dependencies[key]:
+            remaining[dep] -= 1
+            if not remaining[dep] and dep not in outputs:
+                alive.discard(dep)
+    return MemoryEstimate(peak=peak, peak_keys=peak_keys, nbytes=sizes)
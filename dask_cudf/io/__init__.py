@@ -1 +1,2 @@
-from .csv import read_csv
+from .csv import read_csv, to_csv
+from .parquet import read_parquet, to_parquet
@@ -0,0 +1,331 @@
+"""
+Compressed inputs for the readers.
+
+A compressed file is made of *members*, byte ranges of the file that
+decompress independently of each other:
+
+* BGZF files (blocked gzip, as written by ``bgzip``) have one member per
+  block.
+* bz2 files made of several concatenated streams (as written by ``pbzip2``
+  or ``lbzip2``) have one member per stream.
+* Seekable zstd files have one member per frame.
+
+Every other compressed file is a single member.
+
+Files are split into partitions of compressed bytes without reading their
+data.  Seekable zstd files and BGZF files with a ``.gzi`` index are split at
+the member boundaries listed by their index.  BGZF files without an index
+and bz2 files are split at plain byte offsets, and every task finds the
+members starting in its own range, the way ``byte_range`` finds lines.  A
+bz2 file of a single stream thus has all its data read by its first
+partition.
+
+Members are decompressed by a pool of threads, and the members of the next
+partition are decompressed ahead while the current one is parsed.
+"""
+import bz2
+import gzip
+import lzma
+import mmap
+import os
+import re
+import struct
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+_extensions = {
+    ".gz": "gzip",
+    ".bgz": "gzip",
+    ".bz2": "bz2",
+    ".zst": "zstd",
+    ".xz": "xz",
+}
+
+_magic = [
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+    (b"\xfd7zXZ\x00", "xz"),
+]
+
+_bgzf_magic = b"\x1f\x8b\x08\x04"
+_bz2_stream = re.compile(b"BZh[1-9]1AY&SY")
+_zstd_seekable_magic = 0x8F92EAB1
+_zstd_skippable_magic = 0x184D2A5E
+
+
+class MappedFileCache(object):
+    """Least recently used cache of read-only memory maps.
+
+    Maps are keyed by path, size and modification time, so a rewritten file
+    is mapped again.
+    """
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self._maps = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        st = os.stat(path)
+        key = (path, st.st_size, st.st_mtime)
+        with self._lock:
+            if key in self._maps:
+                self._maps.move_to_end(key)
+                return self._maps[key]
+            if st.st_size == 0:
+                mm = b""
+            else:
+                with open(path, "rb") as f:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[key] = mm
+            while len(self._maps) > self.maxsize:
+                # A dropped map is closed once no reader refers to it
+                self._maps.popitem(last=False)
+            return mm
+
+    def clear(self):
+        with self._lock:
+            self._maps.clear()
+
+
+mapped_files = MappedFileCache()
+_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+_pending = OrderedDict()
+_pending_lock = threading.Lock()
+
+
+def infer_compression(path):
+    """The codec of *path* from its extension or its first bytes, or None
+    for uncompressed files"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in _extensions:
+        return _extensions[ext]
+    with open(path, "rb") as f:
+        head = f.read(8)
+    for magic, codec in _magic:
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+def partitions(path, codec, chunksize):
+    """Split *path* into ``(lo, hi)`` ranges of about *chunksize* compressed
+    bytes.  A partition holds the members starting in its range."""
+    if codec not in _decompressors:
+        raise ValueError("Unsupported compression %r" % codec)
+    size = os.path.getsize(path)
+    indexed = _indexed_members(path, codec)
+    if indexed is not None:
+        return _group_members(indexed, chunksize)
+    if size and (codec == "bz2" or (codec == "gzip" and _is_bgzf(path))):
+        return [(lo, min(size, lo + chunksize)) for lo in range(0, size, chunksize)]
+    return [(0, size)]
+
+
+def _group_members(found, chunksize):
+    groups = []
+    lo = None
+    for offset, length in found:
+        if lo is None:
+            lo = offset
+        if offset + length - lo >= chunksize:
+            groups.append((lo, offset + length))
+            lo = None
+    if lo is not None or not groups:
+        groups.append((lo or 0, found[-1][0] + found[-1][1] if found else 0))
+    return groups
+
+
+def _indexed_members(path, codec):
+    """Members listed by an index, without reading the data"""
+    st = os.stat(path)
+    return _read_index(path, codec, st.st_size, st.st_mtime)
+
+
+@lru_cache(maxsize=64)
+def _read_index(path, codec, size, mtime):
+    if codec == "zstd":
+        return _zstd_frames(path, size)
+    if codec == "gzip" and os.path.exists(path + ".gzi"):
+        return _gzi_blocks(path + ".gzi", size)
+    return None
+
+
+def _gzi_blocks(index, size):
+    # A .gzi file (bgzip -i) lists the compressed and uncompressed offsets
+    # of every block but the first
+    with open(index, "rb") as f:
+        (n,) = struct.unpack("<Q", f.read(8))
+        offsets = struct.unpack("<%dQ" % (2 * n), f.read(16 * n))[::2]
+    starts = [0] + [o for o in offsets if 0 < o < size]
+    ends = starts[1:] + [size]
+    return [(lo, hi - lo) for lo, hi in zip(starts, ends)]
+
+
+def _zstd_frames(path, size):
+    with open(path, "rb") as f:
+        if size < 17:
+            return None
+        f.seek(size - 9)
+        nframes, descriptor, magic = struct.unpack("<IBI", f.read(9))
+        if magic != _zstd_seekable_magic:
+            return None
+        entry = 12 if descriptor & 0x80 else 8
+        table = 8 + nframes * entry + 9
+        if table > size:
+            return None
+        f.seek(size - table)
+        skippable, _ = struct.unpack("<II", f.read(8))
+        if skippable != _zstd_skippable_magic:
+            return None
+        entries = f.read(nframes * entry)
+    frames = []
+    offset = 0
+    for i in range(nframes):
+        (length,) = struct.unpack("<I", entries[i * entry : i * entry + 4])
+        frames.append((offset, length))
+        offset += length
+    return frames
+
+
+def _is_bgzf(path):
+    with open(path, "rb") as f:
+        header = f.read(18)
+    return _bgzf_block_size(header) is not None
+
+
+def _bgzf_block_size(header):
+    """Size of the BGZF block starting with *header*, or None"""
+    if len(header) < 12 or header[:4] != _bgzf_magic:
+        return None
+    (xlen,) = struct.unpack("<H", header[10:12])
+    extra = header[12 : 12 + xlen]
+    pos = 0
+    while pos + 6 <= len(extra):
+        (slen,) = struct.unpack("<H", extra[pos + 2 : pos + 4])
+        if extra[pos : pos + 2] == b"BC" and slen == 2:
+            return struct.unpack("<H", extra[pos + 4 : pos + 6])[0] + 1
+        pos += 4 + slen
+    return None
+
+
+def _bgzf_members(data, lo, hi):
+    # Resynchronize on the first block header at or after *lo*.  A header
+    # is only trusted when another block or the end of the file follows it.
+    pos = lo
+    while True:
+        pos = data.find(_bgzf_magic, pos, hi + len(_bgzf_magic) - 1)
+        if pos < 0:
+            return []
+        bsize = _bgzf_block_size(data[pos : pos + 64])
+        end = pos + (bsize or 0)
+        if bsize and (end == len(data) or data[end : end + 4] == _bgzf_magic):
+            break
+        pos += 1
+    found = []
+    while pos < min(hi, len(data)):
+        bsize = _bgzf_block_size(data[pos : pos + 64])
+        if bsize is None:
+            raise ValueError("Corrupt BGZF block at offset %d" % pos)
+        found.append((pos, bsize))
+        pos += bsize
+    return found
+
+
+def _bz2_members(data, lo, hi):
+    # Streams start with a byte-aligned header followed by the magic of the
+    # first block, later blocks of a stream are not byte-aligned
+    starts = [m.start() for m in _bz2_stream.finditer(data, lo, hi + 9)]
+    starts = [s for s in starts if s < hi]
+    if not starts:
+        return []
+    following = _bz2_stream.search(data, starts[-1] + 1)
+    ends = starts[1:] + [following.start() if following else len(data)]
+    return [(s, e - s) for s, e in zip(starts, ends)]
+
+
+def members(path, codec, lo, hi):
+    """``(offset, length)`` of the members of *path* starting in
+    ``[lo, hi)``"""
+    indexed = _indexed_members(path, codec)
+    if indexed is not None:
+        return [(o, n) for o, n in indexed if lo <= o < hi]
+    data = mapped_files.get(path)
+    if codec == "bz2":
+        return _bz2_members(data, lo, hi)
+    if codec == "gzip" and len(data) and _bgzf_block_size(data[:64]):
+        return _bgzf_members(data, lo, hi)
+    return [(0, len(data))] if lo == 0 < len(data) else []
+
+
+def _decompress_zstd(data):
+    import zstandard
+
+    with zstandard.ZstdDecompressor().stream_reader(
+        data, read_across_frames=True
+    ) as reader:
+        return reader.read()
+
+
+_decompressors = {
+    "gzip": gzip.decompress,
+    "bz2": bz2.decompress,
+    "xz": lzma.decompress,
+    "zstd": _decompress_zstd,
+}
+
+
+def _decompress_member(path, codec, offset, length):
+    data = mapped_files.get(path)
+    return _decompressors[codec](data[offset : offset + length])
+
+
+def _submit(path, codec, lo, hi):
+    return [
+        (offset, length, _pool.submit(_decompress_member, path, codec, offset, length))
+        for offset, length in members(path, codec, lo, hi)
+    ]
+
+
+def decompress_range(path, codec, lo, hi):
+    """``(offset, length, future)`` of the members starting in ``[lo, hi)``
+    of *path*, reusing those decompressed ahead by `prefetch_range`"""
+    with _pending_lock:
+        found = _pending.pop((path, codec, lo, hi), None)
+    if found is None:
+        found = _submit(path, codec, lo, hi)
+    return found
+
+
+def prefetch_range(path, codec, lo, hi):
+    """Start decompressing the members starting in ``[lo, hi)`` of *path* in
+    the background"""
+    key = (path, codec, lo, hi)
+    with _pending_lock:
+        if key in _pending:
+            return
+    found = _submit(path, codec, lo, hi)
+    with _pending_lock:
+        _pending[key] = found
+        while len(_pending) > 2:
+            # Nobody read these, drop them rather than hold their memory
+            for _, _, future in _pending.popitem(last=False)[1]:
+                future.cancel()
+
+
+def member_at(path, codec, offset):
+    """``(length, data)`` of the member of *path* starting at *offset*"""
+    future = None
+    with _pending_lock:
+        for (p, c, _, _), found in _pending.items():
+            if p == path and c == codec:
+                for o, n, f in found:
+                    if o == offset:
+                        length, future = n, f
+    if future is not None and not future.cancelled():
+        return length, future.result()
+    length = members(path, codec, offset, offset + 1)[0][1]
+    return length, _decompress_member(path, codec, offset, length)
@@ -1,26 +1,73 @@
 import os
 from glob import glob
+from io import BytesIO
 
 import cudf
-from dask.base import tokenize
+from dask.base import compute_as_if_collection, tokenize
 from dask.compatibility import apply
 import dask.dataframe as dd
+from dask.delayed import Delayed
 from dask.utils import parse_bytes
 
+from dask_cudf.io.compression import (
+    decompress_range,
+    infer_compression,
+    member_at,
+    partitions,
+    prefetch_range,
+)
 
-def read_csv(path, chunksize="128 MiB", **kwargs):
+
+def read_csv(path, chunksize="128 MiB", compression="infer", **kwargs):
+    """Read CSV files into a dask_cudf DataFrame, one partition per
+    *chunksize* bytes of every file.
+
+    Parameters
+    ----------
+    path : str
+        A file or a glob pattern.
+    chunksize : int or str
+        Number of bytes per partition, lines belong to the chunk in which
+        they start.  For compressed files this counts compressed bytes.
+    compression : str or None
+        Codec of the files, one of ``gzip, bz2, zstd, xz``, or ``"infer"``
+        to detect it per file from the extension and the first bytes.
+        BGZF, multi-stream bz2 and seekable zstd files are split at their
+        block boundaries, located by each task within its own byte range
+        unless a ``.gzi`` index or a seek table lists them.  Other compressed
+        files are read as one partition each.  Decompression runs in a pool
+        of threads.
+    **kwargs
+        Passed on to ``cudf.read_csv``.
+    """
     if isinstance(chunksize, str):
         chunksize = parse_bytes(chunksize)
     filenames = sorted(glob(str(path)))  # TODO: lots of complexity
     name = "read-csv-" + tokenize(
-        path, tokenize, **kwargs
+        path, tokenize, compression, **kwargs
     )  # TODO: get last modified time
 
-    meta = cudf.read_csv(filenames[0], **kwargs)
+    if compression == "infer":
+        codecs = [infer_compression(fn) for fn in filenames]
+    else:
+        codecs = [compression] * len(filenames)
+
+    if codecs[0] is None:
+        meta = cudf.read_csv(filenames[0], **kwargs)
+    else:
+        hi = partitions(filenames[0], codecs[0], chunksize)[0][1]
+        meta = _read_compressed_csv(filenames[0], codecs[0], 0, hi, None, kwargs)
+    empty = meta.head(0)
 
     dsk = {}
+    compressed = []
     i = 0
-    for fn in filenames:
+    for fn, codec in zip(filenames, codecs):
+        if codec is not None:
+            for lo, hi in partitions(fn, codec, chunksize):
+                compressed.append(((name, i), fn, codec, lo, hi))
+                i += 1
+            continue
         size = os.path.getsize(fn)
         for start in range(0, size, chunksize):
             kwargs2 = kwargs.copy()
@@ -34,5 +81,91 @@ def read_csv(path, chunksize="128 MiB", **kwargs):
             dsk[(name, i)] = (apply, cudf.read_csv, [fn], kwargs2)
             i += 1
 
+    # Every compressed partition decompresses the next one ahead
+    for j, (key, fn, codec, lo, hi) in enumerate(compressed):
+        kwargs2 = kwargs.copy()
+        if lo != 0:
+            kwargs2["names"] = meta.columns
+            kwargs2["header"] = None
+        ahead = compressed[j + 1][1:] if j + 1 < len(compressed) else None
+        dsk[key] = (_read_compressed_csv, fn, codec, lo, hi, ahead, kwargs2, empty)
+
     divisions = [None] * (len(dsk) + 1)
     return dd.core.new_dd_object(dsk, name, meta, divisions)
+
+
+def _read_compressed_csv(fn, codec, lo, hi, ahead, kwargs, empty=None):
+    found = decompress_range(fn, codec, lo, hi)
+    if ahead is not None:
+        prefetch_range(*ahead)
+    if not found:
+        return empty
+    pieces = [future.result() for _, _, future in found]
+    nbytes = sum(map(len, pieces))
+    # Members split lines anywhere.  Like byte ranges, a partition holds the
+    # lines after the first newline of its members, up to and including the
+    # line that continues into the members that follow.
+    offset, length, _ = found[-1]
+    pos, size = offset + length, os.path.getsize(fn)
+    while pos < size:
+        length, piece = member_at(fn, codec, pos)
+        pieces.append(piece)
+        pos += length
+        if b"\n" in piece:
+            break
+    data = b"".join(pieces)
+    start = 0 if lo == 0 else data.find(b"\n") + 1
+    stop = data.find(b"\n", nbytes)
+    stop = len(data) if stop < 0 else stop + 1
+    if (lo != 0 and start == 0) or start >= stop:
+        return empty
+    return cudf.read_csv(BytesIO(data[start:stop]), **kwargs)
+
+
+def to_csv(df, path, index=True, compute=True, **kwargs):
+    """Write a dask_cudf DataFrame to CSV files, one per partition.
+
+    Parameters
+    ----------
+    df : dask_cudf.DataFrame
+    path : str
+        Either a pattern in which ``*`` is replaced by the partition number,
+        or a directory to write ``part.<i>.csv`` files into.
+    index : bool
+        Write the index.
+    compute : bool
+        Write right away, or return a Delayed that writes when computed.
+    **kwargs
+        Passed on to ``pandas.DataFrame.to_csv``.
+
+    Returns
+    -------
+    filenames : list of str, or a Delayed computing them
+    """
+    path = str(path)
+    if "*" in path:
+        filenames = [path.replace("*", str(i)) for i in range(df.npartitions)]
+    else:
+        os.makedirs(path, exist_ok=True)
+        filenames = [
+            os.path.join(path, "part.%d.csv" % i) for i in range(df.npartitions)
+        ]
+    name = "to-csv-" + tokenize(df, filenames, index, kwargs)
+    dsk = {
+        (name, i): (_write_csv, key, fn, index, kwargs)
+        for i, (key, fn) in enumerate(zip(df.__dask_keys__(), filenames))
+    }
+    final = (name + "-final", 0)
+    dsk[final] = (list, [(name, i) for i in range(df.npartitions)])
+    dsk.update(df.dask)
+    if compute:
+        return compute_as_if_collection(type(df), dsk, [final])[0]
+    return Delayed(final, dsk)
+
+
+def _write_csv(df, fn, index, kwargs):
+    # Formatting happens on the host
+    from dask_cudf.core import _to_pandas
+
+    _to_pandas(df).to_csv(fn, index=index, **kwargs)
+    return fn
@@ -0,0 +1,336 @@
+import json
+import operator
+import os
+import re
+from glob import glob
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from dask.base import compute_as_if_collection, tokenize
+from dask.delayed import Delayed
+import dask.dataframe as dd
+
+import cudf
+from dask_cudf.utils import make_meta
+
+_filter_ops = {
+    "==": operator.eq,
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": None,
+}
+
+
+def read_parquet(
+    path, columns=None, filters=None, index=None, row_groups_per_partition=1
+):
+    """Read a Parquet dataset into a dask_cudf DataFrame.
+
+    Every partition reads *row_groups_per_partition* row groups of one file.
+    The metadata and divisions come from the file footers (or from a
+    ``_metadata`` file next to the data) without reading any data.
+
+    Parameters
+    ----------
+    path : str
+        A file, a glob pattern or a directory of ``*.parquet`` files.
+    columns : list of str, optional
+        Columns to read, defaults to all of them.
+    filters : list of (column, op, value) tuples, optional
+        Skip the row groups whose statistics show that no row satisfies all
+        predicates.  *op* is one of ``==, !=, <, <=, >, >=, in``.  Rows of
+        the remaining row groups are not filtered.
+    index : str or False, optional
+        Column to use as the index.  Defaults to the index stored by pandas,
+        ``False`` reads no index.  Divisions are known when the min/max
+        statistics of a numeric index column are sorted across partitions.
+    row_groups_per_partition : int
+        Number of consecutive row groups of a file read by each partition.
+
+    Examples
+    --------
+    >>> filters = [("id", ">", 10)]
+    >>> df = read_parquet("data/", columns=["x"], filters=filters)  # doctest: +SKIP
+    """
+    files, metadata = _gather_metadata(path)
+    schema = metadata[files[0]].schema.to_arrow_schema()
+    names = [n for n in schema.names if n not in _pandas_index_columns(schema)]
+    if index is None:
+        index = _pandas_index(schema)
+    if columns is None:
+        columns = [n for n in names if n != index]
+    else:
+        columns = list(columns)
+
+    # Without the pandas metadata every stored column stays a column
+    meta = schema.remove_metadata().empty_table().to_pandas()
+    meta = meta[columns + ([index] if index else [])]
+    if index:
+        meta = meta.set_index(index)
+        meta.index.name = _index_name(index)
+    meta = make_meta(meta)
+
+    parts = []
+    for fn in files:
+        md = metadata[fn]
+        row_groups = [
+            i for i in range(md.num_row_groups) if _keep_row_group(md, i, filters)
+        ]
+        for start in range(0, len(row_groups), row_groups_per_partition):
+            rgs = row_groups[start : start + row_groups_per_partition]
+            parts.append((fn, rgs, _index_range(md, rgs, index)))
+
+    name = "read-parquet-" + tokenize(
+        path, files, columns, filters, index, row_groups_per_partition
+    )
+    if not parts:
+        dsk = {(name, 0): meta.head(0)}
+        return dd.core.new_dd_object(dsk, name, meta, [None, None])
+
+    to_read = columns + ([index] if index else [])
+    dsk = {
+        (name, i): (_read_row_groups, fn, rgs, to_read, index)
+        for i, (fn, rgs, _) in enumerate(parts)
+    }
+    ranges = [r for _, _, r in parts]
+    if index and pa.types.is_timestamp(schema.field_by_name(index).type):
+        unit = schema.field_by_name(index).type.unit
+        ranges = [_timestamp_range(r, unit) for r in ranges]
+    divisions = _divisions(ranges, meta)
+    return dd.core.new_dd_object(dsk, name, meta, divisions)
+
+
+def _gather_metadata(path):
+    """The data files of *path* and the footer metadata of each of them"""
+    path = str(path)
+    if os.path.isdir(path):
+        common = os.path.join(path, "_metadata")
+        if os.path.exists(common):
+            return _split_common_metadata(path, pq.read_metadata(common))
+        files = sorted(glob(os.path.join(path, "*.parquet")), key=_natural_key)
+    else:
+        files = sorted(glob(path), key=_natural_key)
+    if not files:
+        raise IOError("No parquet files found at %s" % path)
+    return files, {fn: pq.ParquetFile(fn).metadata for fn in files}
+
+
+def _natural_key(fn):
+    """Sort key putting part.10.parquet after part.9.parquet"""
+    return [int(t) if t.isdigit() else t for t in re.split(r"(\d+)", fn)]
+
+
+def _split_common_metadata(root, metadata):
+    """Map the row groups listed by a ``_metadata`` file to their files"""
+    files = []
+    row_groups = {}
+    for i in range(metadata.num_row_groups):
+        fn = os.path.join(root, metadata.row_group(i).column(0).file_path)
+        if fn not in row_groups:
+            files.append(fn)
+            row_groups[fn] = []
+        row_groups[fn].append(i)
+    return files, {fn: _RowGroupView(metadata, row_groups[fn]) for fn in files}
+
+
+class _RowGroupView(object):
+    """The row groups of one file within a dataset-wide ``_metadata``"""
+
+    def __init__(self, metadata, row_groups):
+        self.schema = metadata.schema
+        self.num_columns = metadata.num_columns
+        self.num_row_groups = len(row_groups)
+        self._metadata = metadata
+        self._row_groups = row_groups
+
+    def row_group(self, i):
+        return self._metadata.row_group(self._row_groups[i])
+
+
+def _pandas_metadata(schema):
+    if not schema.metadata or b"pandas" not in schema.metadata:
+        return {}
+    return json.loads(schema.metadata[b"pandas"].decode("utf8"))
+
+
+def _pandas_index_columns(schema):
+    return [c for c in _pandas_metadata(schema).get("index_columns", []) if c]
+
+
+def _pandas_index(schema):
+    # Only a single physically stored index is restored, a RangeIndex is
+    # described without a column
+    index_columns = _pandas_metadata(schema).get("index_columns", [])
+    if len(index_columns) == 1 and isinstance(index_columns[0], str):
+        return index_columns[0]
+    return False
+
+
+def _index_name(index):
+    return None if index.startswith("__index_level_") else index
+
+
+def _column_statistics(md, i, column):
+    """(min, max) of *column* in row group *i*, or None when unknown"""
+    schema = md.schema
+    for j in range(md.num_columns):
+        if schema.column(j).name == column:
+            break
+    else:
+        return None
+    stats = md.row_group(i).column(j).statistics
+    if stats is None or not getattr(stats, "has_min_max", True):
+        return None
+    lo, hi = stats.min, stats.max
+    if isinstance(lo, bytes):
+        lo, hi = lo.decode("utf8"), hi.decode("utf8")
+    return lo, hi
+
+
+def _keep_row_group(md, i, filters):
+    """Whether row group *i* may hold rows satisfying all *filters*"""
+    for column, op, value in filters or ():
+        if op not in _filter_ops:
+            raise ValueError("Unsupported filter operator %r" % op)
+        stats = _column_statistics(md, i, column)
+        if stats is None:
+            continue
+        lo, hi = stats
+        if op in ("==", "="):
+            keep = lo <= value <= hi
+        elif op == "!=":
+            keep = not (lo == hi == value)
+        elif op == "in":
+            keep = any(lo <= v <= hi for v in value)
+        elif op in ("<", "<="):
+            keep = _filter_ops[op](lo, value)
+        else:
+            keep = _filter_ops[op](hi, value)
+        if not keep:
+            return False
+    return True
+
+
+def _index_range(md, row_groups, index):
+    if not index:
+        return None
+    ranges = [_column_statistics(md, i, index) for i in row_groups]
+    if not ranges or any(r is None for r in ranges):
+        return None
+    return min(r[0] for r in ranges), max(r[1] for r in ranges)
+
+
+def _timestamp_range(r, unit):
+    # Statistics of timestamp columns are datetimes or integers in *unit*
+    if r is None:
+        return None
+    return tuple(
+        pd.Timestamp(v, unit=unit) if isinstance(v, int) else pd.Timestamp(v) for v in r
+    )
+
+
+def _divisions(ranges, meta):
+    """Divisions from the index range of every partition, when the ranges
+    are known and strictly ordered.  Only numeric and datetime indexes get
+    divisions, the statistics of strings are truncated byte strings."""
+    unknown = [None] * (len(ranges) + 1)
+    if any(r is None for r in ranges):
+        return unknown
+    dtype = meta.index.dtype
+    if not (np.issubdtype(dtype, np.number) or np.issubdtype(dtype, np.datetime64)):
+        return unknown
+    for (_, hi), (lo, _) in zip(ranges[:-1], ranges[1:]):
+        if not hi < lo:
+            return unknown
+    return [r[0] for r in ranges] + [ranges[-1][1]]
+
+
+def _read_row_groups(fn, row_groups, columns, index):
+    table = pq.ParquetFile(fn).read_row_groups(row_groups, columns=columns)
+    # Index handling is explicit, ignore what pandas stored
+    table = table.replace_schema_metadata(None)
+    df = cudf.DataFrame.from_arrow(table)
+    if index:
+        df = df.set_index(index)
+        df.index.name = _index_name(index)
+    return df
+
+
+def to_parquet(
+    df,
+    path,
+    write_index=True,
+    write_metadata_file=True,
+    compression="snappy",
+    compute=True,
+):
+    """Write a dask_cudf DataFrame to a directory of Parquet files.
+
+    Every partition is written to its own ``part.<i>.parquet`` file by its
+    own task, with column statistics.  Reading the directory back with
+    `read_parquet` restores the divisions from the index statistics.
+
+    Parameters
+    ----------
+    df : dask_cudf.DataFrame
+    path : str
+        Output directory, created if needed.
+    write_index : bool
+        Store the index as a column.
+    write_metadata_file : bool
+        Also write a ``_metadata`` file gathering the footers of all files,
+        so that readers can plan without opening every file.
+    compression : str or None
+        Parquet compression codec.
+    compute : bool
+        Write right away, or return a Delayed that writes when computed.
+    """
+    path = str(path)
+    os.makedirs(path, exist_ok=True)
+    name = "to-parquet-" + tokenize(
+        df, path, write_index, write_metadata_file, compression
+    )
+    dsk = {
+        (name, i): (
+            _write_partition,
+            key,
+            path,
+            "part.%d.parquet" % i,
+            write_index,
+            compression,
+        )
+        for i, key in enumerate(df.__dask_keys__())
+    }
+    final = (name + "-final", 0)
+    parts = [(name, i) for i in range(df.npartitions)]
+    if write_metadata_file:
+        dsk[final] = (_write_metadata_file, parts, path)
+    else:
+        dsk[final] = (len, parts)
+    dsk.update(df.dask)
+    if compute:
+        compute_as_if_collection(type(df), dsk, [final])
+        return None
+    return Delayed(final, dsk)
+
+
+def _write_partition(df, path, filename, write_index, compression):
+    table = df.to_arrow(preserve_index=write_index)
+    fn = os.path.join(path, filename)
+    pq.write_table(table, fn, compression=compression)
+    md = pq.read_metadata(fn)
+    md.set_file_path(filename)
+    return md
+
+
+def _write_metadata_file(parts, path):
+    metadata = parts[0]
+    for md in parts[1:]:
+        metadata.append_row_groups(md)
+    metadata.write_metadata_file(os.path.join(path, "_metadata"))
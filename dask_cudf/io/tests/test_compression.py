@@ -0,0 +1,141 @@
+import bz2
+import gzip
+import os
+import struct
+import zlib
+from functools import partial
+
+import numpy as np
+import pytest
+
+from dask_cudf.io import compression
+
+TEXT = b"a,b\n" + b"".join(b"%d,%d\n" % (i, i * 7) for i in range(5000))
+
+
+def _bgzf_block(data):
+    co = zlib.compressobj(6, zlib.DEFLATED, -15)
+    cdata = co.compress(data) + co.flush()
+    extra = b"BC" + struct.pack("<HH", 2, 18 + len(cdata) + 8 - 1)
+    header = b"\x1f\x8b\x08\x04" + b"\0" * 4 + b"\0\xff" + struct.pack("<H", 6)
+    trailer = struct.pack("<II", zlib.crc32(data) & 0xFFFFFFFF, len(data))
+    return header + extra + cdata + trailer
+
+
+def write_bgzf(fn, data, blocksize=1000, index=False):
+    blocks = [
+        _bgzf_block(data[i : i + blocksize]) for i in range(0, len(data), blocksize)
+    ]
+    with open(fn, "wb") as f:
+        f.write(b"".join(blocks) + _bgzf_block(b""))
+    if index:
+        # Offsets of every block but the first, as written by bgzip -i
+        offsets = np.cumsum([len(b) for b in blocks]).tolist()
+        with open(fn + ".gzi", "wb") as f:
+            f.write(struct.pack("<Q", len(offsets)))
+            for i, offset in enumerate(offsets):
+                f.write(struct.pack("<QQ", offset, (i + 1) * blocksize))
+
+
+def write_bz2_streams(fn, data, streamsize=10000):
+    with open(fn, "wb") as f:
+        for i in range(0, len(data), streamsize):
+            f.write(bz2.compress(data[i : i + streamsize]))
+
+
+def write_gzip(fn, data):
+    with open(fn, "wb") as f:
+        f.write(gzip.compress(data))
+
+
+def test_infer_compression(tmp_path):
+    fn = str(tmp_path / "data")
+    with open(fn, "wb") as f:
+        f.write(bz2.compress(TEXT))
+    assert compression.infer_compression(fn) == "bz2"
+    assert compression.infer_compression(str(tmp_path / "data.csv.gz")) == "gzip"
+    with open(fn, "wb") as f:
+        f.write(TEXT)
+    assert compression.infer_compression(fn) is None
+
+
+def _read_partitions(fn, codec, chunksize):
+    """Decompressed members of every partition of *fn*"""
+    out = []
+    for lo, hi in compression.partitions(fn, codec, chunksize):
+        found = compression.decompress_range(fn, codec, lo, hi)
+        out.append(b"".join(future.result() for _, _, future in found))
+    return out
+
+
+@pytest.mark.parametrize(
+    "write,nmembers",
+    [
+        (write_bgzf, len(TEXT) // 1000 + 2),
+        (partial(write_bgzf, index=True), len(TEXT) // 1000 + 2),
+        (write_bz2_streams, len(TEXT) // 10000 + 1),
+        (write_gzip, 1),
+    ],
+)
+def test_members(tmp_path, write, nmembers):
+    fn = str(tmp_path / "data.csv.compressed")
+    write(fn, TEXT)
+    codec = compression.infer_compression(fn)
+    found = compression.members(fn, codec, 0, 10 ** 9)
+    assert len(found) == nmembers
+    assert all(a + n == b for (a, n), (b, _) in zip(found[:-1], found[1:]))
+    # Every member is found again from its own offset
+    for offset, length in found:
+        assert compression.member_at(fn, codec, offset)[0] == length
+
+
+@pytest.mark.parametrize("index", [False, True])
+@pytest.mark.parametrize("chunksize", [1, 777, 10 ** 9])
+def test_partitions_bgzf(tmp_path, index, chunksize):
+    fn = str(tmp_path / "data.csv.gz")
+    write_bgzf(fn, TEXT, index=index)
+    parts = compression.partitions(fn, "gzip", chunksize)
+    assert parts[0][0] == 0
+    assert all(a[1] == b[0] for a, b in zip(parts[:-1], parts[1:]))
+    if chunksize == 10 ** 9:
+        assert len(parts) == 1
+    # Every member belongs to exactly one partition
+    assert b"".join(_read_partitions(fn, "gzip", chunksize)) == TEXT
+
+
+@pytest.mark.parametrize("streamsize", [10000, len(TEXT)])
+def test_partitions_bz2(tmp_path, streamsize):
+    fn = str(tmp_path / "data.csv.bz2")
+    write_bz2_streams(fn, TEXT, streamsize=streamsize)
+    pieces = _read_partitions(fn, "bz2", 1000)
+    assert b"".join(pieces) == TEXT
+    if streamsize == len(TEXT):
+        # A single stream cannot be split
+        assert sum(map(bool, pieces)) == 1
+
+
+def test_partitions_gzip(tmp_path):
+    fn = str(tmp_path / "data.csv.gz")
+    write_gzip(fn, TEXT)
+    assert compression.partitions(fn, "gzip", 10) == [(0, os.path.getsize(fn))]
+
+
+def test_zstd_seek_table(tmp_path):
+    frames = [b"\x28\xb5\x2f\xfd" + b"x" * n for n in (10, 20, 5)]
+    entries = b"".join(struct.pack("<III", len(f), 0, 0) for f in frames)
+    table = entries + struct.pack("<IBI", 3, 0x80, 0x8F92EAB1)
+    fn = str(tmp_path / "data.csv.zst")
+    with open(fn, "wb") as f:
+        f.write(b"".join(frames) + struct.pack("<II", 0x184D2A5E, len(table)) + table)
+    assert compression.members(fn, "zstd", 0, 100) == [(0, 14), (14, 24), (38, 9)]
+    assert compression.partitions(fn, "zstd", 30) == [(0, 38), (38, 47)]
+
+
+def test_prefetch_range(tmp_path):
+    fn = str(tmp_path / "data.csv.bz2")
+    write_bz2_streams(fn, TEXT)
+    lo, hi = compression.partitions(fn, "bz2", 2000)[1]
+    compression.prefetch_range(fn, "bz2", lo, hi)
+    found = compression.decompress_range(fn, "bz2", lo, hi)
+    expect = compression.members(fn, "bz2", lo, hi)
+    assert [(o, n) for o, n, _ in found] == expect
@@ -3,6 +3,9 @@ import dask_cudf
 import dask.dataframe as dd
 import pandas as pd
 import numpy as np
+import pytest
+
+import cudf
 
 
 def test_read_csv(tmp_path):
@@ -28,3 +31,48 @@ def test_read_csv_w_bytes(tmp_path):
     result = df2.compute().to_pandas()
     expected = df.compute()
     dd.assert_eq(result, expected, check_index=False)
+
+
+def test_to_csv(tmp_path):
+    df = pd.DataFrame({"x": np.arange(20), "y": np.arange(20) * 2.0})
+    gdf = dask_cudf.from_cudf(cudf.DataFrame.from_pandas(df), npartitions=4)
+
+    filenames = gdf.to_csv(str(tmp_path / "data-*.csv"), index=False)
+    assert filenames == [str(tmp_path / ("data-%d.csv" % i)) for i in range(4)]
+    got = pd.concat([pd.read_csv(fn) for fn in filenames], ignore_index=True)
+    dd.assert_eq(got, df)
+
+    filenames = gdf.to_csv(str(tmp_path / "out"), index=False)
+    assert len(filenames) == 4
+    df2 = dask_cudf.read_csv(str(tmp_path / "out" / "*.csv"))
+    dd.assert_eq(df2.compute().to_pandas(), df, check_index=False)
+
+
+@pytest.mark.parametrize("codec", ["bgzf", "bz2", "gzip"])
+@pytest.mark.parametrize("chunksize", ["1 kB", "1 MiB"])
+def test_read_csv_compressed(tmp_path, codec, chunksize):
+    from dask_cudf.io.tests.test_compression import (
+        write_bgzf,
+        write_bz2_streams,
+        write_gzip,
+    )
+
+    df = pd.DataFrame(dict(x=np.arange(2000), y=np.arange(2000) * 2))
+    data = df.to_csv(index=False).encode()
+    for i in range(3):
+        fn = str(tmp_path / ("data-%d.csv.%s" % (i, "bz2" if codec == "bz2" else "gz")))
+        if codec == "bgzf":
+            write_bgzf(fn, data)
+        elif codec == "bz2":
+            write_bz2_streams(fn, data)
+        else:
+            write_gzip(fn, data)
+
+    df2 = dask_cudf.read_csv(str(tmp_path / "*.csv.*"), chunksize=chunksize)
+    if codec == "gzip" or chunksize == "1 MiB":
+        # One partition per file
+        assert df2.npartitions == 3
+    else:
+        assert df2.npartitions > 3
+    expected = pd.concat([df] * 3, ignore_index=True)
+    dd.assert_eq(df2.compute().to_pandas(), expected, check_index=False)
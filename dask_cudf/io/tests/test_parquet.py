@@ -0,0 +1,146 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+import dask.dataframe as dd
+
+import dask_cudf
+
+
+def _write(tmp_path, nfiles=2, nrows=100, row_group_size=25):
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    dfs = []
+    for i in range(nfiles):
+        df = pd.DataFrame(
+            {
+                "x": np.arange(nrows) + i * nrows,
+                "y": np.random.normal(size=nrows),
+                "z": np.arange(nrows) % 7,
+            },
+            index=pd.Index(np.arange(nrows) + i * nrows, name="id"),
+        )
+        table = pa.Table.from_pandas(df)
+        pq.write_table(
+            table,
+            str(tmp_path / ("part.%d.parquet" % i)),
+            row_group_size=row_group_size,
+        )
+        dfs.append(df)
+    return pd.concat(dfs)
+
+
+def test_read_parquet(tmp_path):
+    expect = _write(tmp_path)
+    df = dask_cudf.read_parquet(str(tmp_path))
+    assert df.npartitions == 8
+    assert df.divisions == tuple(range(0, 200, 25)) + (199,)
+    dd.assert_eq(df.compute().to_pandas(), expect)
+
+
+def test_read_parquet_row_groups_per_partition(tmp_path):
+    expect = _write(tmp_path)
+    df = dask_cudf.read_parquet(str(tmp_path / "*.parquet"), row_groups_per_partition=3)
+    # Partitions never span files
+    assert df.npartitions == 4
+    assert df.divisions == (0, 75, 100, 175, 199)
+    dd.assert_eq(df.compute().to_pandas(), expect)
+
+
+def test_read_parquet_columns_and_index(tmp_path):
+    expect = _write(tmp_path)
+    df = dask_cudf.read_parquet(str(tmp_path), columns=["y"])
+    assert list(df.columns) == ["y"]
+    dd.assert_eq(df.compute().to_pandas(), expect[["y"]])
+
+    df = dask_cudf.read_parquet(str(tmp_path), columns=["y"], index="x")
+    assert df.known_divisions
+    assert df.compute().to_pandas().index.name == "x"
+
+    df = dask_cudf.read_parquet(str(tmp_path), index=False)
+    assert not df.known_divisions
+    assert list(df.columns) == ["x", "y", "z"]
+
+
+@pytest.mark.parametrize(
+    "filters,npartitions",
+    [
+        ([("x", "<", 30)], 2),
+        ([("x", ">=", 150)], 2),
+        ([("x", "==", 60)], 1),
+        ([("x", "in", [10, 110])], 2),
+        ([("x", ">", 20), ("x", "<", 70)], 3),
+        ([("x", ">", 1000)], 1),
+    ],
+)
+def test_read_parquet_filters(tmp_path, filters, npartitions):
+    expect = _write(tmp_path)
+    df = dask_cudf.read_parquet(str(tmp_path), filters=filters)
+    assert df.npartitions == npartitions
+
+    got = df.compute().to_pandas()
+    # Whole row groups are kept, every matching row is among them
+    mask = np.ones(len(expect), dtype=bool)
+    for column, op, value in filters:
+        if op == "in":
+            mask &= expect[column].isin(value).values
+        else:
+            mask &= eval("expect[column] %s value" % op).values
+    assert set(expect.index[mask]) <= set(got.index.values)
+
+
+def test_read_parquet_meta_without_reading(tmp_path):
+    _write(tmp_path)
+    df = dask_cudf.read_parquet(str(tmp_path))
+    assert list(df._meta.columns) == ["x", "y", "z"]
+    assert df._meta.index.name == "id"
+    assert list(df._meta.dtypes) == [np.dtype("i8"), np.dtype("f8"), np.dtype("i8")]
+
+
+@pytest.mark.parametrize("write_metadata_file", [True, False])
+def test_to_parquet_roundtrip(tmp_path, write_metadata_file):
+    expect = _write(tmp_path / "in")
+    df = dask_cudf.read_parquet(str(tmp_path / "in"), row_groups_per_partition=2)
+
+    out = str(tmp_path / "out")
+    df.to_parquet(out, write_metadata_file=write_metadata_file)
+    names = sorted(os.listdir(out))
+    assert names.count("_metadata") == int(write_metadata_file)
+    assert len([n for n in names if n.endswith(".parquet")]) == df.npartitions
+
+    df2 = dask_cudf.read_parquet(out)
+    # Divisions come back from the statistics alone
+    assert df2.divisions == df.divisions
+    dd.assert_eq(df2.compute().to_pandas(), expect)
+
+
+def test_to_parquet_delayed(tmp_path):
+    _write(tmp_path / "in")
+    df = dask_cudf.read_parquet(str(tmp_path / "in"))
+    out = str(tmp_path / "out")
+    task = df.to_parquet(out, compute=False)
+    assert not any(n.endswith(".parquet") for n in os.listdir(out))
+    task.compute()
+    assert len(dask_cudf.read_parquet(out).compute()) == 200
+
+
+def test_to_parquet_metadata_file_in_token(tmp_path):
+    _write(tmp_path / "in")
+    df = dask_cudf.read_parquet(str(tmp_path / "in"))
+    a = df.to_parquet(str(tmp_path / "out"), compute=False)
+    b = df.to_parquet(str(tmp_path / "out"), write_metadata_file=False, compute=False)
+    assert a.key != b.key
+
+
+def test_read_parquet_datetime_divisions(tmp_path):
+    index = pd.date_range("2019-01-01", periods=100, freq="H", name="ts")
+    expect = pd.DataFrame({"x": np.arange(100)}, index=index)
+    pq.write_table(
+        pa.Table.from_pandas(expect), str(tmp_path / "data.parquet"), row_group_size=25
+    )
+    df = dask_cudf.read_parquet(str(tmp_path))
+    assert df.known_divisions
+    assert df.divisions == tuple(index[::25]) + (index[-1],)
+    dd.assert_eq(df.compute().to_pandas(), expect)
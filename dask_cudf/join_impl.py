@@ -1,10 +1,26 @@
-from functools import partial
+import operator
+from functools import partial, reduce
 
 import numpy as np
+import pandas as pd
+from toolz import merge_with
+
 from dask import delayed
+from dask.dataframe import methods
+from dask.utils import Dispatch
 
 import cudf
 from dask_cudf import core
+from dask_cudf.utils import null_column
+
+
+hash_partition = Dispatch("hash_partition")
+
+
+@hash_partition.register(pd.DataFrame)
+def _hash_partition_pandas(frame, columns, nparts):
+    buckets = pd.util.hash_pandas_object(frame[list(columns)], index=False) % nparts
+    return dict(iter(frame.groupby(buckets.values)))
 
 
 @delayed
@@ -37,7 +53,105 @@ def fanout_subgroups(grouped_parts, num_new_parts):
     ]
 
 
-def join_frames(left, right, on, how, lsuffix, rsuffix):
+def sample_key_counts(frame, on, sample_size):
+    """Estimate the number of rows of every key of *frame*.
+
+    Counts the keys of about *sample_size* evenly strided rows on the host
+    and scales them back up to the length of the frame.
+    """
+    stride = max(1, len(frame) // sample_size)
+    sample = frame[list(on)].take(np.arange(0, len(frame), stride))
+    if not isinstance(sample, pd.DataFrame):
+        sample = sample.to_pandas()
+    counts = sample.groupby(list(on)).size() * stride
+    if len(on) == 1:
+        return {(k,): int(v) for k, v in counts.items()}
+    return {tuple(k): int(v) for k, v in counts.items()}
+
+
+def find_hot_keys(counts, nparts, threshold):
+    """Assign the keys that would overload a bucket to several buckets.
+
+    Parameters
+    ----------
+    counts : dict
+        Estimated number of rows of each key tuple.
+    nparts : int
+        Number of buckets.
+    threshold : float
+        A key is hot when it holds more than *threshold* times the rows of
+        an average bucket.
+
+    Returns
+    -------
+    hot : dict
+        Maps each hot key tuple to the list of buckets its rows go to.
+    """
+    total = sum(counts.values())
+    if not total or nparts < 2:
+        return {}
+    average = total / nparts
+    hot = {}
+    start = 0
+    for key, count in sorted(counts.items(), key=lambda kv: -kv[1]):
+        if count <= threshold * average:
+            break
+        nsplit = int(min(nparts, max(2, np.ceil(count / average))))
+        hot[key] = [(start + j) % nparts for j in range(nsplit)]
+        start += nsplit
+    return hot
+
+
+def skew_partition(frame, on, nparts, hot, replicate):
+    """Regroup *frame* into buckets, spreading the rows of hot keys.
+
+    Rows of cold keys are hashed as usual.  The rows of each hot key are
+    either split into contiguous slices over the key's buckets or, with
+    *replicate*, copied to every one of them.
+    """
+    groups = {}
+    masks = []
+    for key, buckets in hot.items():
+        mask = reduce(operator.and_, [frame[c] == v for c, v in zip(on, key)])
+        masks.append(mask)
+        rows = frame[mask]
+        if not len(rows):
+            continue
+        if replicate:
+            pieces = [(b, rows) for b in buckets]
+        else:
+            bounds = np.linspace(0, len(rows), len(buckets) + 1).astype(int)
+            pieces = [
+                (b, rows[lo:hi])
+                for b, lo, hi in zip(buckets, bounds[:-1], bounds[1:])
+                if hi > lo
+            ]
+        for b, piece in pieces:
+            groups.setdefault(b, []).append(piece)
+
+    if masks:
+        frame = frame[~reduce(operator.or_, masks)]
+    if len(frame):
+        for b, piece in hash_partition(frame, on, nparts).items():
+            if len(piece):
+                groups.setdefault(b, []).append(piece)
+
+    return {
+        b: pieces[0] if len(pieces) == 1 else methods.concat(pieces)
+        for b, pieces in groups.items()
+    }
+
+
+def _concat_parts(parts):
+    parts = [p for p in parts if not isinstance(p, tuple)]
+    if not parts:
+        return None
+    return methods.concat(parts)
+
+
+def join_frames(
+    left, right, on, how, lsuffix, rsuffix, skew_threshold=None, sample_size=1000
+):
     """Join two frames on 1 or more columns.
 
     Parameters
@@ -48,7 +162,14 @@ def join_frames(left, right, on, how, lsuffix, rsuffix):
     how : str
         Join method
     lsuffix, rsuffix : str
-
+    skew_threshold : float, optional
+        Enables skew handling.  Keys of *left* estimated to hold more than
+        *skew_threshold* times the rows of an average bucket have their
+        rows split over several buckets, and the matching rows of *right*
+        are replicated to each of them.
+    sample_size : int
+        Number of rows per partition of *left* sampled to estimate the key
+        frequencies when *skew_threshold* is given.
     """
     assert how == "left"
 
@@ -60,18 +181,9 @@ def join_frames(left, right, on, how, lsuffix, rsuffix):
         for k in left_val_names:
             newdf[fix_name(k, lsuffix)] = df[k]
         for k in right_val_names:
-            newdf[fix_name(k, rsuffix)] = nullcolumn(len(df), dtypes[k])
+            newdf[fix_name(k, rsuffix)] = null_column(len(df), dtypes[k])
         return newdf
 
-    def nullcolumn(nelem, dtype):
-        data = np.zeros(nelem, dtype=dtype)
-        mask_size = cudf.utils.utils.calc_chunk_size(
-            data.size, cudf.utils.utils.mask_bitsize
-        )
-        mask = np.zeros(mask_size, dtype=cudf.utils.utils.mask_dtype)
-        sr = cudf.Series.from_masked_array(data=data, mask=mask, null_count=data.size)
-        return sr
-
     empty_frame = left._meta.merge(
         right._meta, on=on, how=how, lsuffix=lsuffix, rsuffix=rsuffix
     )
@@ -110,8 +222,25 @@ def join_frames(left, right, on, how, lsuffix, rsuffix):
     # Add column w/ hash(v) % nparts
     nparts = max(len(left_parts), len(right_parts))
 
-    left_hashed = group_frame(left_parts, nparts, on)
-    right_hashed = group_frame(right_parts, nparts, on)
+    if skew_threshold is not None:
+        # The hot keys are found inside the graph, which keeps the join lazy
+        # and its shape independent of them
+        samples = [
+            delayed(sample_key_counts)(part, on, sample_size) for part in left_parts
+        ]
+        counts = delayed(merge_with)(sum, *samples)
+        hot = delayed(find_hot_keys)(counts, nparts, skew_threshold)
+        left_hashed = [
+            delayed(skew_partition)(part, on, nparts, hot, False) for part in left_parts
+        ]
+        right_hashed = [
+            delayed(skew_partition)(part, on, nparts, hot, True) for part in right_parts
+        ]
+        concat = _concat_parts
+    else:
+        left_hashed = group_frame(left_parts, nparts, on)
+        right_hashed = group_frame(right_parts, nparts, on)
+        concat = cudf.concat
 
     # Fanout each partition into nparts subgroups
     left_subgroups = fanout_subgroups(left_hashed, nparts)
@@ -120,8 +249,8 @@ def join_frames(left, right, on, how, lsuffix, rsuffix):
     assert len(left_subgroups) == len(right_subgroups)
 
     # Concat
-    left_cats = [delayed(cudf.concat, pure=True)(it) for it in left_subgroups]
-    right_cats = [delayed(cudf.concat, pure=True)(it) for it in right_subgroups]
+    left_cats = [delayed(concat, pure=True)(it) for it in left_subgroups]
+    right_cats = [delayed(concat, pure=True)(it) for it in right_subgroups]
 
     # Combine
     merged = [delayed(merge)(left_cats[i], right_cats[i]) for i in range(nparts)]
@@ -0,0 +1,184 @@
+"""
+Fixed-size sketches summarizing partitions for approximate reductions.
+"""
+import math
+
+import numpy as np
+import pandas as pd
+from dask.utils import Dispatch
+
+# ----------------------------------------------------------------------
+# HyperLogLog distinct count
+# ----------------------------------------------------------------------
+#
+# Values are hashed to 32 bits.  The top *precision* bits select one of
+# ``2 ** precision`` registers and the register keeps the largest rank, the
+# position of the first set bit, seen among the remaining bits.  Each value
+# is encoded as ``bucket * 64 + rank`` so that a partition reduces to the
+# set of its distinct codes, at most ``2 ** precision * 33`` of them.
+
+hll_sketch = Dispatch("hll_sketch")
+
+
+def hll_precision(relative_error):
+    """Number of index bits for a HyperLogLog with *relative_error*"""
+    if not 0 < relative_error < 1:
+        raise ValueError("relative_error must be between 0 and 1")
+    nregisters = (1.04 / relative_error) ** 2
+    return int(min(16, max(4, math.ceil(math.log2(nregisters)))))
+
+
+def hll_codes(hashes, precision):
+    """Encode 32-bit *hashes* as ``bucket * 64 + rank`` (NumPy reference)"""
+    hashes = np.asarray(hashes).astype(np.uint32).astype(np.int64)
+    shift = 32 - precision
+    bucket = hashes >> shift
+    rest = hashes & ((1 << shift) - 1)
+    nbits = np.zeros(len(rest), dtype=np.int64)
+    nonzero = rest > 0
+    nbits[nonzero] = np.floor(np.log2(rest[nonzero])).astype(np.int64) + 1
+    return bucket * 64 + (shift - nbits + 1)
+
+
+def hll_code_func(precision):
+    """Element-wise version of `hll_codes` to compile for the device"""
+    shift = 32 - precision
+    mask = (1 << shift) - 1
+
+    def code(h):
+        u = h & 0xFFFFFFFF
+        rest = u & mask
+        rank = shift + 1
+        while rest:
+            rest >>= 1
+            rank -= 1
+        return (u >> shift) * 64 + rank
+
+    return code
+
+
+def hll_registers(codes, precision):
+    """Registers of a sketch from (possibly repeated) codes"""
+    codes = np.asarray(codes, dtype=np.int64)
+    registers = np.zeros(1 << precision, dtype=np.uint8)
+    np.maximum.at(registers, codes >> 6, (codes & 63).astype(np.uint8))
+    return registers
+
+
+def hll_merge(sketches):
+    """Merge sketches by keeping the largest rank of every register"""
+    return np.maximum.reduce(list(sketches))
+
+
+def hll_estimate(registers):
+    """Estimated number of distinct values summarized by *registers*"""
+    m = len(registers)
+    if m >= 128:
+        alpha = 0.7213 / (1 + 1.079 / m)
+    else:
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}[m]
+    estimate = alpha * m * m / np.sum(2.0 ** -registers.astype(np.float64))
+    zeros = np.count_nonzero(registers == 0)
+    if estimate <= 2.5 * m and zeros:
+        # Small range correction, count the empty registers instead
+        estimate = m * math.log(m / zeros)
+    elif estimate > 2 ** 32 / 30:
+        # Large range correction for collisions of 32-bit hashes
+        estimate = -(2 ** 32) * math.log(1 - estimate / 2 ** 32)
+    return int(round(estimate))
+
+
+def hll_aggregate(sketches):
+    return hll_estimate(hll_merge(sketches))
+
+
+@hll_sketch.register(pd.Series)
+def _hll_sketch_pandas(x, precision):
+    hashes = pd.util.hash_pandas_object(x.dropna(), index=False).values
+    return hll_registers(hll_codes(hashes & 0xFFFFFFFF, precision), precision)
+
+
+# ----------------------------------------------------------------------
+# Quantile summary
+# ----------------------------------------------------------------------
+#
+# A summary is a tuple ``(values, weights, lo, hi)``: sorted sample points,
+# the number of rows each of them stands for, and the exact minimum and
+# maximum.  Merging concatenates the points and compresses them back to at
+# most *size* points of equal weight, so the rank error is about
+# ``1 / size`` per level of the reduction tree.
+
+quantile_summary = Dispatch("quantile_summary")
+
+
+def summary_from_sorted(values, size):
+    """Summary of the sorted NumPy array *values* (reference
+    implementation)"""
+    n = len(values)
+    if n == 0:
+        return _empty_summary(values.dtype)
+    points = values[summary_positions(n, size)]
+    return make_summary(points, n, values[0], values[-1])
+
+
+def summary_positions(n, size):
+    """Positions of the evenly ranked points summarizing *n* sorted rows"""
+    if n <= size:
+        return np.arange(n)
+    return ((np.arange(size) + 0.5) * n / size).astype(np.int64)
+
+
+def make_summary(points, nrows, lo, hi):
+    """Summary of *nrows* rows from the points at `summary_positions`"""
+    return (points, np.full(len(points), nrows / len(points)), lo, hi)
+
+
+def _empty_summary(dtype):
+    return (np.empty(0, dtype=dtype), np.empty(0), None, None)
+
+
+def summary_merge(summaries, size):
+    """Merge quantile summaries, keeping at most *size* points"""
+    summaries = [s for s in summaries if len(s[0])]
+    if not summaries:
+        return _empty_summary(np.float64)
+    values = np.concatenate([s[0] for s in summaries])
+    weights = np.concatenate([s[1] for s in summaries])
+    lo = min(s[2] for s in summaries)
+    hi = max(s[3] for s in summaries)
+    order = np.argsort(values, kind="mergesort")
+    values, weights = values[order], weights[order]
+    if len(values) > size:
+        # Resample at evenly spaced ranks of the merged points
+        cumulative = np.cumsum(weights)
+        total = cumulative[-1]
+        ranks = (np.arange(size) + 0.5) * total / size
+        values = values[np.searchsorted(cumulative, ranks, side="left")]
+        weights = np.full(size, total / size)
+    return (values, weights, lo, hi)
+
+
+def summary_quantiles(summary, q):
+    """Interpolate the quantiles *q* (floats in [0, 1]) from *summary*"""
+    values, weights, lo, hi = summary
+    q = np.asarray(q, dtype=np.float64)
+    if not len(values):
+        return np.full(q.shape, np.nan)
+    cumulative = np.cumsum(weights)
+    total = cumulative[-1]
+    # Every point sits in the middle of the rows it stands for
+    ranks = np.concatenate([[0], cumulative - weights / 2, [total]])
+    points = np.concatenate([[lo], values, [hi]]).astype(np.float64)
+    return np.interp(q * total, ranks, points)
+
+
+def summary_splitters(summary, npartitions):
+    """Boundaries splitting the summarized values into *npartitions* ranges
+    of about equal size, suitable as divisions"""
+    splitters = summary_quantiles(summary, np.linspace(0, 1, npartitions + 1))
+    return sorted(set(splitters.tolist()))
+
+
+@quantile_summary.register(pd.Series)
+def _quantile_summary_pandas(x, size):
+    return summary_from_sorted(np.sort(x.dropna().values), size)
@@ -0,0 +1,251 @@
+"""
+Device-memory budgeted cache for persisted partitions.
+
+Partitions are kept on the device until the device budget is exceeded, at
+which point the least recently used ones are moved to host memory and, once
+the host budget is exceeded too, to disk.  Spilled partitions are moved back
+to the device transparently the next time a task asks for them.
+"""
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from collections import Counter, OrderedDict
+
+from dask.base import compute_as_if_collection, tokenize
+from dask.sizeof import sizeof
+from dask.utils import parse_bytes
+
+
+class HostBackend(object):
+    """Stand-in backend keeping "device" partitions in host memory.
+
+    Moving a partition to host memory pickles it, so the eviction logic of
+    `PartitionCache` can be exercised with pandas or numpy objects and
+    without a GPU.
+    """
+
+    def sizeof(self, obj):
+        return sizeof(obj)
+
+    def to_host(self, obj):
+        return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def to_device(self, obj):
+        return pickle.loads(obj)
+
+
+class CudfBackend(HostBackend):
+    """Backend moving cudf partitions between device and host memory"""
+
+    def to_host(self, obj):
+        return obj.to_pandas()
+
+    def to_device(self, obj):
+        import cudf
+
+        return cudf.from_pandas(obj)
+
+
+class PartitionCache(object):
+    """Cache of persisted partitions with a device memory budget.
+
+    Parameters
+    ----------
+    device_budget : int or str
+        Number of bytes of partitions to keep on the device, e.g. "4 GiB".
+    host_budget : int or str, optional
+        Number of bytes of spilled partitions to keep in host memory before
+        spilling them further to disk.  Defaults to no limit.
+    spill_directory : str, optional
+        Where to write partitions spilled to disk.  Defaults to a fresh
+        temporary directory.
+    backend : HostBackend, optional
+        How partitions are measured and moved between device and host.
+        Defaults to `CudfBackend`.
+
+    Examples
+    --------
+    >>> cache = PartitionCache(device_budget="2 GiB")  # doctest: +SKIP
+    >>> df = df.persist(cache=cache)  # doctest: +SKIP
+    >>> cache.counters  # doctest: +SKIP
+    Counter({'hits': 12, 'spilled_to_host': 3, 'misses': 3, 'unspilled': 3})
+    """
+
+    def __init__(
+        self, device_budget, host_budget=None, spill_directory=None, backend=None
+    ):
+        if isinstance(device_budget, str):
+            device_budget = parse_bytes(device_budget)
+        if isinstance(host_budget, str):
+            host_budget = parse_bytes(host_budget)
+        self.device_budget = device_budget
+        self.host_budget = host_budget
+        self.backend = backend or CudfBackend()
+        self._spill_directory = spill_directory
+        self._device = OrderedDict()
+        self._host = OrderedDict()
+        self._disk = {}
+        self._nbytes = {}
+        self.device_bytes = 0
+        self.host_bytes = 0
+        self.counters = Counter()
+        self._lock = threading.RLock()
+
+    def __repr__(self):
+        s = "<PartitionCache | device: %d/%d bytes | host: %d | disk: %d>"
+        return s % (
+            self.device_bytes,
+            self.device_budget,
+            len(self._host),
+            len(self._disk),
+        )
+
+    def __len__(self):
+        return len(self._device) + len(self._host) + len(self._disk)
+
+    def __contains__(self, key):
+        return key in self._device or key in self._host or key in self._disk
+
+    def location(self, key):
+        """Where *key* currently lives: "device", "host" or "disk" """
+        if key in self._device:
+            return "device"
+        elif key in self._host:
+            return "host"
+        elif key in self._disk:
+            return "disk"
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            if key in self:
+                del self[key]
+            nbytes = self.backend.sizeof(value)
+            self._nbytes[key] = nbytes
+            if nbytes > self.device_budget:
+                # Never fits, keep it off the device right away
+                self._store_host(key, self.backend.to_host(value))
+                self.counters["spilled_to_host"] += 1
+            else:
+                self._device[key] = value
+                self.device_bytes += nbytes
+                self._evict_device(keep=key)
+
+    def __getitem__(self, key):
+        with self._lock:
+            if key in self._device:
+                self._device.move_to_end(key)
+                self.counters["hits"] += 1
+                return self._device[key]
+
+            if key in self._host:
+                payload = self._host.pop(key)
+                self.host_bytes -= self.backend.sizeof(payload)
+            elif key in self._disk:
+                payload = self._load_disk(key)
+            else:
+                raise KeyError(key)
+            self.counters["misses"] += 1
+            self.counters["unspilled"] += 1
+
+            value = self.backend.to_device(payload)
+            self._device[key] = value
+            self.device_bytes += self._nbytes[key]
+            self._evict_device(keep=key)
+            return value
+
+    def __delitem__(self, key):
+        with self._lock:
+            if key in self._device:
+                del self._device[key]
+                self.device_bytes -= self._nbytes[key]
+            elif key in self._host:
+                payload = self._host.pop(key)
+                self.host_bytes -= self.backend.sizeof(payload)
+            elif key in self._disk:
+                os.remove(self._disk.pop(key))
+            else:
+                raise KeyError(key)
+            del self._nbytes[key]
+
+    def clear(self):
+        """Drop all partitions and remove the spill directory"""
+        with self._lock:
+            for key in list(self._nbytes):
+                del self[key]
+            if self._spill_directory is not None:
+                shutil.rmtree(self._spill_directory, ignore_errors=True)
+                self._spill_directory = None
+
+    @property
+    def spill_directory(self):
+        if self._spill_directory is None:
+            self._spill_directory = tempfile.mkdtemp(prefix="dask-cudf-spill-")
+        return self._spill_directory
+
+    def _evict_device(self, keep):
+        while self.device_bytes > self.device_budget:
+            key = next(iter(self._device))
+            if key == keep:
+                if len(self._device) == 1:
+                    break
+                self._device.move_to_end(key)
+                continue
+            value = self._device.pop(key)
+            self.device_bytes -= self._nbytes[key]
+            self._store_host(key, self.backend.to_host(value))
+            self.counters["spilled_to_host"] += 1
+
+    def _store_host(self, key, payload):
+        self._host[key] = payload
+        self.host_bytes += self.backend.sizeof(payload)
+        if self.host_budget is None:
+            return
+        while self.host_bytes > self.host_budget and self._host:
+            key, payload = self._host.popitem(last=False)
+            self.host_bytes -= self.backend.sizeof(payload)
+            self._store_disk(key, payload)
+            self.counters["spilled_to_disk"] += 1
+
+    def _store_disk(self, key, payload):
+        path = os.path.join(self.spill_directory, tokenize(key))
+        with open(path, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self._disk[key] = path
+
+    def _load_disk(self, key):
+        path = self._disk.pop(key)
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+        os.remove(path)
+        return payload
+
+    def persist(self, collection, **kwargs):
+        """Compute *collection* and hold its partitions in this cache.
+
+        Each partition is inserted as soon as it is computed, so partitions
+        spill while the computation is still running instead of all of them
+        being resident at the end.  The returned collection reads its
+        partitions back from the cache.
+        """
+        name = collection._name
+        store = "cache-store-" + tokenize(collection, id(self))
+        dsk = dict(collection.dask)
+        keys = []
+        for i, key in enumerate(collection.__dask_keys__()):
+            dsk[(store, i)] = (_store, self, name, i, key)
+            keys.append((store, i))
+        compute_as_if_collection(type(collection), dsk, keys, **kwargs)
+
+        dsk = {(name, i): (_load, self, name, i) for i in range(len(keys))}
+        return type(collection)(dsk, name, collection._meta, collection.divisions)
+
+
+def _store(cache, name, i, value):
+    cache[(name, i)] = value
+
+
+def _load(cache, name, i):
+    return cache[(name, i)]
@@ -29,6 +29,58 @@ def test_from_cudf():
     assert_frame_equal(ddf.compute(), df)
 
 
+def test_from_cudf_copy():
+    np.random.seed(0)
+    df = pd.DataFrame(
+        {"x": np.random.randint(0, 5, size=1000), "y": np.random.normal(size=1000)}
+    )
+    gdf = cudf.DataFrame.from_pandas(df)
+
+    eager = dgd.from_cudf(gdf, npartitions=4)
+    lazy = dgd.from_cudf(gdf, npartitions=4, copy=False)
+    assert lazy.divisions == eager.divisions
+    # The source frame is referenced once rather than once per partition
+    assert len(lazy.dask) == lazy.npartitions + 1
+    assert_frame_equal(lazy.compute().to_pandas(), df)
+
+
+def test_from_cudf_skips_sorting_sorted_input(monkeypatch):
+    gdf = cudf.DataFrame({"x": np.arange(100)})
+
+    def fail(*args, **kwargs):
+        raise AssertionError("sorted input should not be sorted again")
+
+    monkeypatch.setattr(cudf.DataFrame, "sort_index", fail)
+    ddf = dgd.from_cudf(gdf, npartitions=4)
+    assert ddf.known_divisions
+    assert ddf.divisions[0] == 0 and ddf.divisions[-1] == 99
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 7, 50])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_splits_divisions_sorted_numpy(chunksize, seed):
+    np.random.seed(seed)
+    values = np.sort(np.random.randint(0, 20, size=100))
+    splits, divisions = dask_cudf.core.splits_divisions_sorted_numpy(values, chunksize)
+
+    assert splits[0] == 0 and splits[-1] == len(values)
+    assert all(a < b for a, b in zip(splits[:-1], splits[1:]))
+    # Runs of equal values are never split across partitions
+    assert all(values[s - 1] != values[s] for s in splits[1:-1])
+    assert divisions == tuple(values[splits[:-1]]) + (values[-1],)
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 7, 50])
+def test_splits_divisions_sorted_cudf_matches_numpy(chunksize):
+    np.random.seed(0)
+    values = np.sort(np.random.randint(0, 20, size=100))
+    gdf = cudf.DataFrame({"x": np.arange(100)}).set_index(cudf.Series(values))
+
+    got = dask_cudf.core.splits_divisions_sorted_cudf(gdf, chunksize)
+    expect = dask_cudf.core.splits_divisions_sorted_numpy(values, chunksize)
+    assert got == expect
+
+
 def _fragmented_gdf(df, nsplit):
     n = len(df)
 
@@ -56,6 +108,35 @@ def test_concat():
     assert_frame_equal(df, concated.compute().to_pandas())
 
 
+def test_concat_interleave_partitions():
+    np.random.seed(0)
+    df1 = pd.DataFrame({"x": np.arange(100), "y": np.random.normal(size=100)})
+    df2 = pd.DataFrame(
+        {"x": np.arange(100), "y": np.random.normal(size=100)}, index=np.arange(50, 150)
+    )
+    a = dgd.from_cudf(cudf.DataFrame.from_pandas(df1), npartitions=3)
+    b = dgd.from_cudf(cudf.DataFrame.from_pandas(df2), npartitions=4)
+
+    with pytest.raises(ValueError):
+        dgd.concat([a, b])
+
+    concated = dgd.concat([a, b], interleave_partitions=True)
+    assert concated.known_divisions
+    assert concated.divisions[0] == 0 and concated.divisions[-1] == 149
+
+    got = concated.compute().to_pandas()
+    expect = pd.concat([df1, df2])
+    np.testing.assert_array_equal(np.sort(got.index.values), np.sort(expect.index))
+    # Every partition only holds rows within its divisions
+    for i, part in enumerate(concated.to_delayed()):
+        index = part.compute().to_pandas().index
+        lo, hi = concated.divisions[i], concated.divisions[i + 1]
+        assert ((index >= lo) & (index <= hi)).all()
+    got = got.reset_index().sort_values(["index", "y"]).reset_index(drop=True)
+    expect = expect.reset_index().sort_values(["index", "y"]).reset_index(drop=True)
+    assert_frame_equal(got, expect)
+
+
 def test_append():
     np.random.seed(0)
 
@@ -163,6 +244,28 @@ def test_from_dask_dataframe():
     np.testing.assert_array_equal(got.y.values, expect.y.values)
 
 
+def test_from_dask_dataframe_strings_and_categories():
+    df = pd.DataFrame(
+        {
+            "x": np.arange(20),
+            "s": ["a", "bb", "ccc", "dddd"] * 5,
+            "c": pd.Categorical(["u", "v"] * 10),
+        }
+    )
+    ddf = dd.from_pandas(df, npartitions=3)
+    dgdf = dgd.from_dask_dataframe(ddf)
+    got = dgdf.compute().to_pandas()
+
+    np.testing.assert_array_equal(got.index.values, df.index.values)
+    np.testing.assert_array_equal(got.x.values, df.x.values)
+    np.testing.assert_array_equal(got.s.values, df.s.values)
+    np.testing.assert_array_equal(got.c.values, df.c.values)
+
+    roundtrip = dgdf.to_dask_dataframe().compute()
+    np.testing.assert_array_equal(roundtrip.s.values, df.s.values)
+    np.testing.assert_array_equal(roundtrip.index.values, df.index.values)
+
+
 @pytest.mark.parametrize("nelem", [10, 200, 1333])
 def test_set_index(nelem):
     with dask.config.set(scheduler="single-threaded"):
@@ -322,3 +425,100 @@ def test_repr(func):
     assert repr(gddf)
     if hasattr(pdf, "_repr_html_"):
         assert gddf._repr_html_()
+
+
+def test_iter_partitions():
+    df = pd.DataFrame({"x": np.arange(100), "y": np.arange(100) * 2.0})
+    ddf = dgd.from_cudf(cudf.DataFrame.from_pandas(df), npartitions=5)
+    ddf = ddf.map_partitions(lambda df: df.assign(z=df.x + 1))
+    expect = [p.compute().to_pandas() for p in ddf.to_delayed()]
+
+    got = [p.to_pandas() for p in ddf.iter_partitions()]
+    assert len(got) == 5
+    for a, b in zip(got, expect):
+        assert_frame_equal(a, b)
+
+    got = [p.to_pandas() for p in ddf.compute(stream=True, max_in_flight=1)]
+    assert_frame_equal(pd.concat(got), pd.concat(expect))
+
+
+@pytest.mark.parametrize("scheduler", [None, "threads"])
+def test_iter_partitions_bounded(scheduler):
+    import time
+
+    computed = []
+
+    def record(df):
+        computed.append(len(df))
+        return df
+
+    gdf = cudf.DataFrame.from_pandas(pd.DataFrame({"x": np.arange(100)}))
+    ddf = dgd.from_cudf(gdf, npartitions=10).map_partitions(record, meta=gdf)
+
+    parts = ddf.iter_partitions(max_in_flight=2, scheduler=scheduler)
+    next(parts)
+    time.sleep(0.5)
+    # The partition taken and the two following ones
+    assert len(computed) == 3
+    next(parts)
+    next(parts)
+    time.sleep(0.5)
+    assert len(computed) == 5
+    parts.close()
+    time.sleep(0.5)
+    assert len(computed) == 5
+
+
+@pytest.mark.parametrize("scheduler", [None, "threads"])
+def test_iter_partitions_shared(scheduler):
+    computed = []
+
+    def record(df):
+        computed.append(len(df))
+        return df
+
+    gdf = cudf.DataFrame.from_pandas(pd.DataFrame({"x": np.arange(100)}))
+    ddf = dgd.from_cudf(gdf, npartitions=10).map_partitions(record, meta=gdf)
+    # Every partition depends on the total over all of them
+    out = ddf.map_partitions(lambda df, total: df.x + total, ddf.x.sum())
+
+    got = [
+        p.to_pandas() for p in out.iter_partitions(max_in_flight=1, scheduler=scheduler)
+    ]
+    assert len(got) == 10
+    np.testing.assert_array_equal(pd.concat(got).values, np.arange(100) + 4950)
+    assert len(computed) == 10
+
+
+def test_iter_partitions_scheduler():
+    gdf = cudf.DataFrame.from_pandas(pd.DataFrame({"x": np.arange(10)}))
+    ddf = dgd.from_cudf(gdf, npartitions=2)
+    with pytest.raises(ValueError, match="scheduler"):
+        next(ddf.iter_partitions(scheduler=lambda dsk, keys, **kwargs: None))
+
+
+def test_iter_partitions_error():
+    def fail(df):
+        raise ValueError("boom")
+
+    gdf = cudf.DataFrame.from_pandas(pd.DataFrame({"x": np.arange(10)}))
+    ddf = dgd.from_cudf(gdf, npartitions=2).map_partitions(fail, meta=gdf)
+    with pytest.raises(ValueError, match="boom"):
+        list(ddf.iter_partitions())
+
+
+@pytest.mark.parametrize("npartitions", [1, 4])
+def test_compute_concat_columns(npartitions):
+    df = pd.DataFrame(
+        {"x": np.arange(100), "y": np.arange(100) * 2.0, "z": np.arange(100) % 3},
+        index=np.arange(100, 200),
+    )
+    ddf = dgd.from_cudf(cudf.DataFrame.from_pandas(df), npartitions=npartitions)
+    ddf = ddf.map_partitions(lambda df: df.query("z != 1"))
+
+    got = ddf.compute(concat="columns").to_pandas()
+    assert_frame_equal(got, ddf.compute().to_pandas())
+    assert_frame_equal(got, df[df.z != 1])
+
+    with pytest.raises(ValueError):
+        ddf.compute(concat="tree")
@@ -0,0 +1,178 @@
+import json
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import cudf as gd
+import dask_cudf as dgd
+from dask_cudf import batcher_sortnet
+from dask.sizeof import sizeof
+from dask_cudf.diagnostics import (
+    MemoryTracker,
+    Profiler,
+    estimate_peak_memory,
+    graph_stats,
+)
+
+
+def _make_frame(npartitions, nrows=256, start=0):
+    np.random.seed(0)
+    df = pd.DataFrame(
+        {"x": np.random.randint(0, 8, size=nrows), "y": np.random.normal(size=nrows)},
+        index=np.arange(start, start + nrows),
+    )
+    return dgd.from_cudf(gd.DataFrame.from_pandas(df), npartitions=npartitions)
+
+
+def _make_series(npartitions, nrows=256):
+    # Built directly, so that reductions have no column selection layer
+    np.random.seed(0)
+    s = pd.Series(np.random.randint(0, 8, size=nrows), name="x")
+    return dgd.from_cudf(gd.Series.from_pandas(s), npartitions=npartitions)
+
+
+def _combine_sizes(npartitions, split_every):
+    """Number of combine tasks at every level of a tree reduction"""
+    sizes = []
+    k = npartitions
+    while k > split_every:
+        k = math.ceil(k / split_every)
+        sizes.append(k)
+    return sizes
+
+
+def test_graph_stats():
+    ddf = _make_frame(4)
+    stats = graph_stats(ddf)
+    assert stats.ntasks == 4
+    assert stats.depth == 1
+    assert stats.width == 4
+
+    stats = graph_stats(_make_series(4).nlargest(3, split_every=2))
+    assert stats.ntasks == 4 + 4 + 2 + 1
+    assert stats.depth == 4
+    assert stats.width == 4
+    assert stats.layers["from_cudf"] == 4
+    assert stats.layers["nlargest-chunk"] == 4
+    assert stats.layers["nlargest-combine"] == 2
+    assert stats.layers["nlargest-agg"] == 1
+
+
+@pytest.mark.parametrize("npartitions", [2, 4, 8, 16])
+def test_sort_values_task_count(npartitions):
+    ddf = _make_frame(npartitions)
+    stats = graph_stats(ddf.sort_values("x"))
+    # One compare and two getitem tasks per comparator of the network
+    ncomparators = len(list(batcher_sortnet.oddeven_merge_sort(npartitions)))
+    assert stats.ntasks <= 3 * ncomparators + 8 * npartitions
+    k = math.log2(npartitions)
+    assert stats.depth <= 2 * k * (k + 1) / 2 + 8
+
+
+@pytest.mark.parametrize("npartitions", [2, 4, 8, 16])
+def test_merge_task_count(npartitions):
+    left = _make_frame(npartitions)
+    right = _make_frame(npartitions // 2 or 1)
+    nparts = max(left.npartitions, right.npartitions)
+    ninputs = left.npartitions + right.npartitions
+    stats = graph_stats(left.merge(right, on=("x",), how="left"))
+    # The all-to-all get_subgroup layer is the only quadratic one
+    assert stats.layers["get_subgroup"] == nparts * ninputs
+    assert stats.ntasks <= nparts * ninputs + 2 * ninputs + 5 * nparts
+    assert stats.depth <= 8
+
+
+@pytest.mark.parametrize("npartitions", [2, 4, 8, 16])
+def test_join_task_count(npartitions):
+    df = pd.DataFrame({"a": np.arange(64)})
+    left = dgd.from_cudf(gd.DataFrame.from_pandas(df), npartitions=npartitions)
+    right = dgd.from_cudf(gd.DataFrame.from_pandas(df * 2), npartitions=npartitions)
+    stats = graph_stats(left.join(right, rsuffix="_r"))
+    assert stats.ntasks <= 8 * npartitions
+    assert stats.depth <= 6
+
+
+@pytest.mark.parametrize("npartitions", [2, 8, 32])
+@pytest.mark.parametrize("split_every", [2, 8])
+def test_reduction_task_count(npartitions, split_every):
+    series = _make_series(npartitions)
+    stats = graph_stats(series.nlargest(3, split_every=split_every))
+    combines = _combine_sizes(npartitions, split_every)
+    assert stats.layers["from_cudf"] == npartitions
+    assert stats.layers["nlargest-chunk"] == npartitions
+    assert stats.layers.get("nlargest-combine", 0) == sum(combines)
+    assert stats.layers["nlargest-agg"] == 1
+    assert stats.ntasks == 2 * npartitions + sum(combines) + 1
+    # Input, chunk, every combine level and the aggregate
+    assert stats.depth == len(combines) + 3
+
+
+@pytest.mark.parametrize("npartitions", [2, 8, 32])
+def test_concat_task_count(npartitions):
+    a = _make_frame(npartitions)
+    b = _make_frame(npartitions, start=1000)
+    stats = graph_stats(dgd.concat([a, b]))
+    assert stats.ntasks == 4 * npartitions
+    assert stats.depth == 2
+
+    b = _make_frame(npartitions, start=100)
+    stats = graph_stats(dgd.concat([a, b], interleave_partitions=True))
+    assert stats.ntasks <= 16 * npartitions
+
+
+def test_profiler(tmpdir):
+    series = _make_series(4)
+    with Profiler() as prof:
+        series.nlargest(3, split_every=2).compute(optimize_graph=False)
+
+    table = prof.to_table()
+    # The input partitions are data, not tasks
+    assert len(table) == 4 + 2 + 1
+    chunks = table[table.layer == "nlargest-chunk"]
+    assert len(chunks) == 4
+    assert chunks.rows_in.sum() == 256
+    assert (chunks.rows_out == 3).all()
+    assert (table.duration >= 0).all()
+
+    summary = prof.summary()
+    assert summary.loc["nlargest-chunk", "ntasks"] == 4
+
+    path = str(tmpdir.join("trace.json"))
+    trace = prof.to_chrome_trace(path)
+    assert len(trace["traceEvents"]) == len(table)
+    with open(path) as f:
+        assert json.load(f) == trace
+
+
+def test_memory_tracker():
+    ddf = _make_frame(4)
+    parts = [p.compute() for p in ddf.to_delayed()]
+    total = sum(map(sizeof, parts))
+
+    # The keys of sort_values are not deterministic, keep this graph
+    out = ddf.sort_values("x")
+    with MemoryTracker() as mem:
+        out.compute(optimize_graph=False)
+    # All partitions are inputs held by the graph for the whole computation
+    assert mem.peak >= total
+    assert len(mem.timeline) > 0
+    assert max(size for _, size in mem.timeline) == mem.peak
+    assert all(k in dict(out.dask) for k in mem.peak_keys)
+
+
+def test_estimate_peak_memory():
+    ddf = _make_frame(4)
+    parts = [p.compute() for p in ddf.to_delayed()]
+    total = sum(map(sizeof, parts))
+
+    # A reduction releases every partition once it has been reduced
+    est = estimate_peak_memory(ddf.x.nlargest(3, split_every=2))
+    assert est.peak <= total + 4 * sizeof(parts[0])
+
+    # Stacking the partitions keeps all of them alive until the end
+    stacked = dgd.concat([ddf, _make_frame(4, start=1000)])
+    est = estimate_peak_memory(stacked)
+    assert est.peak >= 2 * total
+    assert set(stacked.__dask_keys__()) <= set(est.peak_keys)
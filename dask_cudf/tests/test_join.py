@@ -1,11 +1,13 @@
 from functools import partial
 
 import numpy as np
+import pandas as pd
 import pytest
 
 import cudf as gd
 import dask_cudf as dgd
 import dask.dataframe as dd
+from dask_cudf import join_impl
 
 param_nrows = [5, 10, 50, 100]
 
@@ -204,3 +206,98 @@ def test_merge_1col_left(left_nrows, right_nrows, left_nkeys, right_nkeys, how="
     got = got.sort_values(["x", "a_x", "a_y"]).reset_index(drop=True)
 
     dd.assert_eq(expect, got)
+
+
+def _skewed_frames(nrows=1000):
+    np.random.seed(0)
+    # Half of the left rows share key 0
+    x = np.where(np.random.random(nrows) < 0.5, 0, np.random.randint(1, 50, nrows))
+    left = pd.DataFrame({"x": x, "a": np.arange(nrows, dtype=np.float64)})
+    right = pd.DataFrame(
+        {"x": np.repeat(np.arange(40), 2), "b": np.arange(80, dtype=np.float64)}
+    )
+    return left, right
+
+
+def test_find_hot_keys():
+    counts = {(0,): 500, (1,): 100, (2,): 60}
+    hot = join_impl.find_hot_keys(counts, nparts=4, threshold=1.0)
+    assert hot == {(0,): [0, 1, 2, 3]}
+    assert join_impl.find_hot_keys(counts, nparts=1, threshold=1.0) == {}
+
+
+def test_skew_partition_pandas():
+    left, right = _skewed_frames()
+    on = ("x",)
+    nparts = 4
+    left_parts = [left[i : i + 250] for i in range(0, len(left), 250)]
+    right_parts = [right[:40], right[40:]]
+
+    counts = {}
+    for part in left_parts:
+        for k, v in join_impl.sample_key_counts(part, on, 100).items():
+            counts[k] = counts.get(k, 0) + v
+    hot = join_impl.find_hot_keys(counts, nparts, 1.0)
+    assert list(hot) == [(0,)]
+
+    def regroup(parts, replicate):
+        buckets = {}
+        for part in parts:
+            groups = join_impl.skew_partition(part, on, nparts, hot, replicate)
+            for b, frame in groups.items():
+                buckets.setdefault(b, []).append(frame)
+        return {b: pd.concat(frames) for b, frames in buckets.items()}
+
+    left_buckets = regroup(left_parts, False)
+    right_buckets = regroup(right_parts, True)
+    assert sum(map(len, left_buckets.values())) == len(left)
+    # No bucket holds the bulk of the hot key any more
+    assert max(map(len, left_buckets.values())) < 0.5 * len(left)
+
+    got = pd.concat(
+        [
+            left_buckets[b].merge(right_buckets.get(b, right[:0]), on="x", how="left")
+            for b in left_buckets
+        ]
+    )
+    expect = left.merge(right, on="x", how="left")
+
+    def normalize(df):
+        return df.sort_values(["a", "b"]).reset_index(drop=True)
+
+    dd.assert_eq(normalize(got), normalize(expect))
+
+
+def test_merge_left_skewed():
+    left, right = _skewed_frames()
+    expect = left.merge(right, on="x", how="left")
+
+    left = dgd.from_cudf(gd.DataFrame.from_pandas(left), npartitions=4)
+    right = dgd.from_cudf(gd.DataFrame.from_pandas(right), npartitions=2)
+    result = left.merge(right, on=("x",), how="left", skew_threshold=1.0)
+    sizes = [len(part.compute()) for part in result.to_delayed()]
+    assert max(sizes) < 0.5 * len(expect)
+
+    def normalize(df):
+        return df.sort_values(["a", "b"]).reset_index(drop=True)
+
+    got = result.compute(scheduler="single-threaded").to_pandas()
+    dd.assert_eq(normalize(got), normalize(expect))
+
+
+def test_merge_left_skewed_is_lazy(monkeypatch):
+    left, right = _skewed_frames()
+    calls = []
+    sample_key_counts = join_impl.sample_key_counts
+
+    def record(*args, **kwargs):
+        calls.append(1)
+        return sample_key_counts(*args, **kwargs)
+
+    monkeypatch.setattr(join_impl, "sample_key_counts", record)
+    left = dgd.from_cudf(gd.DataFrame.from_pandas(left), npartitions=4)
+    right = dgd.from_cudf(gd.DataFrame.from_pandas(right), npartitions=2)
+    result = left.merge(right, on=("x",), how="left", skew_threshold=1.0)
+    assert not calls
+    result.compute()
+    assert len(calls) == left.npartitions
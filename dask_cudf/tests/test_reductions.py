@@ -40,3 +40,38 @@ def test_series_reduce(reducer):
     got = reducer(gdf.x)
     exp = reducer(df.x)
     assert_eq(got, exp)
+
+
+@pytest.mark.parametrize("method", ["nlargest", "nsmallest"])
+@pytest.mark.parametrize("prune", [False, True])
+def test_series_top_k(method, prune):
+    np.random.seed(0)
+    df, gdf = _make_random_frame(100, npartitions=5)
+
+    got = getattr(gdf.y, method)(7, split_every=2, prune=prune)
+    exp = getattr(df.y, method)(7)
+    assert_eq(got.compute().to_pandas(), exp)
+
+
+@pytest.mark.parametrize("method", ["nlargest", "nsmallest"])
+@pytest.mark.parametrize("columns", ["y", ["x", "y"]])
+def test_dataframe_top_k(method, columns):
+    np.random.seed(0)
+    df, gdf = _make_random_frame(100, npartitions=5)
+
+    got = getattr(gdf, method)(7, columns=columns, prune=True)
+    exp = getattr(df, method)(7, columns=columns)
+    assert_eq(got.compute().to_pandas(), exp)
+
+
+def test_top_k_prunes_partitions():
+    x = np.arange(100, dtype=np.float64)
+    gdf = dgd.from_cudf(gd.DataFrame.from_pandas(pd.DataFrame({"x": x})), 10)
+    # Only the last partition can hold the 5 largest values
+    pruned = dgd.core._prune_top_k(gdf, 5, "x", largest=True)
+    assert pruned.npartitions == 1
+    pruned = dgd.core._prune_top_k(gdf, 15, "x", largest=False)
+    assert pruned.npartitions == 2
+    assert_eq(
+        gdf.x.nlargest(5, prune=True).compute().to_pandas(), pd.Series(x).nlargest(5)
+    )
@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.util.testing import assert_frame_equal
+
+import cudf
+import dask_cudf as dgd
+from dask_cudf import core
+
+
+def _make_frame(nelem, npartitions):
+    np.random.seed(0)
+    df = pd.DataFrame(
+        {"x": np.random.randint(0, 5, size=nelem), "y": np.random.normal(size=nelem)}
+    )
+    return df, dgd.from_cudf(cudf.DataFrame.from_pandas(df), npartitions=npartitions)
+
+
+def test_cuts_by_npartitions():
+    assert core._cuts_by_npartitions([10, 0, 5, 30], 3) == [0, 15, 30, 45]
+    # Never more partitions than rows
+    assert core._cuts_by_npartitions([3], 10) == [0, 1, 2, 3]
+
+
+def test_cuts_by_partition_size():
+    nrows = [10, 10, 10, 100, 5, 5]
+    nbytes = [100, 100, 100, 1000, 50, 50]
+    # Small neighbours are coalesced, the large partition is split
+    got = core._cuts_by_partition_size(nrows, nbytes, 250)
+    assert got == [0, 20, 30, 55, 80, 105, 130, 140]
+    got = core._cuts_by_partition_size(nrows, nbytes, 1000)
+    assert got == [0, 30, 130, 140]
+
+
+@pytest.mark.parametrize("npartitions", [1, 3, 7, 20])
+def test_repartition_npartitions(npartitions):
+    df, ddf = _make_frame(100, 5)
+    out = ddf.repartition(npartitions=npartitions)
+    assert out.npartitions == npartitions
+    assert_frame_equal(out.compute().to_pandas(), df)
+
+
+@pytest.mark.parametrize("npartitions", [1, 2, 3, 5])
+def test_repartition_coalesce_is_lazy(monkeypatch, npartitions):
+    df, ddf = _make_frame(100, 5)
+
+    def fail(df):
+        raise AssertionError("coalescing should not compute partition sizes")
+
+    monkeypatch.setattr(core, "_partition_sizes", fail)
+    out = ddf.repartition(npartitions=npartitions)
+    assert out.npartitions == npartitions
+    assert out.known_divisions
+    assert out.divisions[0] == ddf.divisions[0]
+    assert out.divisions[-1] == ddf.divisions[-1]
+    assert_frame_equal(out.compute().to_pandas(), df)
+
+
+def test_repartition_balance():
+    df, ddf = _make_frame(100, 5)
+    out = ddf.query("x > 1").repartition(npartitions=2, balance=True)
+    sizes = [len(p.compute()) for p in out.to_delayed()]
+    assert abs(sizes[0] - sizes[1]) <= 1
+    assert_frame_equal(out.compute().to_pandas(), df.query("x > 1"))
+
+
+def test_repartition_partition_size():
+    df, ddf = _make_frame(1000, 10)
+    nrows, nbytes = core._partition_sizes(ddf)
+    assert nrows == [100] * 10
+
+    out = ddf.repartition(partition_size=2 * nbytes[0])
+    assert out.npartitions == 5
+    for part in out.to_delayed():
+        assert len(part.compute()) == 200
+    assert_frame_equal(out.compute().to_pandas(), df)
+    # Only coalescing whole partitions keeps known divisions
+    assert out.known_divisions
+
+    out = ddf.repartition(partition_size=1000)
+    assert out.npartitions > ddf.npartitions
+    assert_frame_equal(out.compute().to_pandas(), df)
+
+
+def test_repartition_divisions():
+    df, ddf = _make_frame(100, 2)
+    out = ddf.repartition(divisions=[0, 10, 50, 99])
+    assert out.divisions == (0, 10, 50, 99)
+    assert_frame_equal(out.compute().to_pandas(), df)
+    part = out.to_delayed()[1].compute().to_pandas()
+    assert_frame_equal(part, df.loc[10:49])
+
+
+def test_repartition_empty_partitions():
+    df, ddf = _make_frame(100, 4)
+    ddf = ddf.query("x > 10")
+    out = ddf.repartition(npartitions=2, balance=True)
+    assert out.npartitions == 1
+    assert len(out.compute()) == 0
+
+
+def test_repartition_requires_one_argument():
+    _, ddf = _make_frame(10, 2)
+    with pytest.raises(ValueError):
+        ddf.repartition()
+    with pytest.raises(ValueError):
+        ddf.repartition(npartitions=2, partition_size="1 MiB")
+
+
+@pytest.mark.parametrize("persist", [False, True])
+def test_drop_empty_partitions(persist):
+    df = pd.DataFrame({"x": np.arange(100), "y": np.arange(100) % 7})
+    ddf = dgd.from_cudf(cudf.DataFrame.from_pandas(df), npartitions=10)
+    filtered = ddf.query("x < 25 or x >= 90")
+    expect = df.query("x < 25 or x >= 90")
+
+    if persist:
+        out = filtered.persist(drop_empty=True)
+    else:
+        out = filtered.drop_empty_partitions()
+    assert out.npartitions == 4
+    assert out.divisions == (0, 10, 20, 90, 99)
+    assert_frame_equal(out.compute().to_pandas(), expect)
+
+
+def test_drop_empty_partitions_all_empty():
+    _, ddf = _make_frame(100, 4)
+    out = ddf.query("x > 10").drop_empty_partitions(nrows=[0, 0, 0, 0])
+    assert out.npartitions == 1
+    assert out.divisions == (ddf.divisions[0], ddf.divisions[-1])
+    assert len(out.compute()) == 0
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import cudf as gd
+import dask_cudf as dgd
+from dask_cudf import sketches
+
+
+def test_hll_precision():
+    assert sketches.hll_precision(0.01) == 14
+    assert sketches.hll_precision(0.5) == 4
+    with pytest.raises(ValueError):
+        sketches.hll_precision(0)
+
+
+def test_hll_code_func_matches_numpy():
+    np.random.seed(0)
+    hashes = np.random.randint(-2 ** 31, 2 ** 31, size=1000)
+    code = sketches.hll_code_func(10)
+    expect = sketches.hll_codes(hashes, 10)
+    np.testing.assert_array_equal([code(int(h)) for h in hashes], expect)
+
+
+@pytest.mark.parametrize("nunique", [1, 10, 1000, 100000])
+def test_hll_pandas(nunique):
+    np.random.seed(0)
+    s = pd.Series(np.random.randint(0, nunique, size=3 * nunique))
+    precision = sketches.hll_precision(0.01)
+    parts = [sketches.hll_sketch(s.iloc[i::4], precision) for i in range(4)]
+    got = sketches.hll_aggregate(parts)
+    expect = s.nunique()
+    assert abs(got - expect) <= max(3 * 0.01 * expect, 1)
+
+
+@pytest.mark.parametrize("split_every", [None, 2])
+def test_nunique_approx(split_every):
+    np.random.seed(0)
+    x = np.random.randint(0, 20000, size=100000)
+    gdf = gd.DataFrame.from_pandas(pd.DataFrame({"x": x}))
+    ddf = dgd.from_cudf(gdf, npartitions=8)
+
+    got = ddf.x.nunique_approx(relative_error=0.02, split_every=split_every)
+    got = got.compute()
+    expect = len(np.unique(x))
+    assert abs(got - expect) <= 3 * 0.02 * expect
+
+
+def _exponential(n=100000):
+    np.random.seed(0)
+    return pd.Series(np.random.exponential(size=n))
+
+
+def test_quantile_summary_pandas():
+    x = _exponential()
+    size = 200
+    parts = [sketches.quantile_summary(x.iloc[i::16], size) for i in range(16)]
+    tree = [sketches.summary_merge(parts[i : i + 4], size) for i in range(0, 16, 4)]
+    summary = sketches.summary_merge(tree, size)
+    assert len(summary[0]) <= size
+    assert summary[2] == x.min() and summary[3] == x.max()
+
+    q = [0, 0.1, 0.25, 0.5, 0.9, 1]
+    got = sketches.summary_quantiles(summary, q)
+    # Compare ranks, the rank error is bounded by the summary size
+    ranks = np.searchsorted(np.sort(x.values), got) / len(x)
+    np.testing.assert_allclose(ranks, q, atol=0.02)
+
+
+def test_summary_splitters():
+    x = _exponential()
+    summary = sketches.quantile_summary(x, 500)
+    splitters = sketches.summary_splitters(summary, 4)
+    assert splitters[0] == x.min() and splitters[-1] == x.max()
+    counts = np.histogram(x, bins=splitters)[0]
+    np.testing.assert_allclose(counts / len(x), 0.25, atol=0.01)
+
+
+def test_summary_empty():
+    summary = sketches.summary_merge([sketches.quantile_summary(pd.Series([]), 10)], 10)
+    assert np.isnan(sketches.summary_quantiles(summary, 0.5))
+
+
+@pytest.mark.parametrize("q", [0.5, [0.1, 0.5, 0.9]])
+def test_series_quantile_sketch(q):
+    x = _exponential()
+    ddf = dgd.from_cudf(gd.DataFrame.from_pandas(pd.DataFrame({"x": x})), 8)
+
+    got = ddf.x.quantile(q, method="sketch", split_every=2).compute()
+    if isinstance(q, list):
+        got = got.to_pandas().values
+    ranks = np.searchsorted(np.sort(x.values), got) / len(x)
+    np.testing.assert_allclose(ranks, q, atol=0.02)
+
+    summary = ddf.x.quantile_summary().compute()
+    splitters = sketches.summary_splitters(summary, 8)
+    assert len(splitters) == 9
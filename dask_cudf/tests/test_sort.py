@@ -43,3 +43,42 @@ def test_sort_values_binned():
             assert not (
                 part_uniques[i] & part_uniques[j]
             ), "should have empty intersection"
+
+
+@pytest.mark.parametrize("ascending", [True, False, [True, False], [False, True]])
+@pytest.mark.parametrize("nparts", [1, 3, 8])
+def test_sort_values_multiple_keys(nparts, ascending):
+    np.random.seed(0)
+    nelem = 200
+    pdf = pd.DataFrame(
+        {
+            "a": np.random.randint(0, 5, nelem),
+            "b": np.random.randint(0, 10, nelem),
+            "c": np.arange(nelem),
+        }
+    )
+    ddf = dgd.from_cudf(gd.DataFrame.from_pandas(pdf), npartitions=nparts)
+
+    with dask.config.set(scheduler="single-threaded"):
+        got = ddf.sort_values(by=["a", "b"], ascending=ascending).compute()
+    got = got.to_pandas()
+    expect = pdf.sort_values(by=["a", "b"], ascending=ascending)
+    # Ties may come from any partition, only compare the keys
+    pd.util.testing.assert_frame_equal(
+        got[["a", "b"]], expect[["a", "b"]].reset_index(drop=True)
+    )
+    assert sorted(got.c) == list(range(nelem))
+
+
+@pytest.mark.parametrize("na_position", ["first", "last"])
+def test_sort_values_nulls(na_position):
+    pdf = pd.DataFrame(
+        {"a": [3.0, np.nan, 1.0, 2.0, np.nan, 1.0], "b": [1, 2, 3, 4, 5, 6]}
+    )
+    ddf = dgd.from_cudf(gd.DataFrame.from_pandas(pdf), npartitions=2)
+
+    with dask.config.set(scheduler="single-threaded"):
+        got = ddf.sort_values(by=["a", "b"], na_position=na_position).compute()
+    expect = pdf.sort_values(by=["a", "b"], na_position=na_position)
+    got = got.to_pandas()
+    np.testing.assert_array_equal(got.b.values, expect.b.values)
@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.util.testing import assert_frame_equal
+
+import cudf
+import dask_cudf as dgd
+from dask_cudf.spill import HostBackend, PartitionCache
+
+
+def _make_cache(**kwargs):
+    return PartitionCache(backend=HostBackend(), **kwargs)
+
+
+def test_lru_spill_to_host():
+    cache = _make_cache(device_budget=250)
+    for i in range(3):
+        cache[i] = np.arange(10, dtype="i8") + i  # 80 bytes each
+    assert cache.device_bytes == 240
+    assert cache.counters["spilled_to_host"] == 0
+
+    # Touch 0 so that 1 becomes the least recently used
+    np.testing.assert_array_equal(cache[0], np.arange(10))
+    cache[3] = np.arange(10, dtype="i8") + 3
+    assert cache.location(1) == "host"
+    assert [cache.location(i) for i in (0, 2, 3)] == ["device"] * 3
+    assert cache.counters["spilled_to_host"] == 1
+    assert cache.device_bytes <= cache.device_budget
+
+
+def test_unspill_on_access():
+    cache = _make_cache(device_budget=100)
+    cache["a"] = np.ones(10, dtype="i8")
+    cache["b"] = np.zeros(10, dtype="i8")
+    assert cache.location("a") == "host"
+
+    np.testing.assert_array_equal(cache["a"], np.ones(10))
+    assert cache.location("a") == "device"
+    assert cache.location("b") == "host"
+    assert cache.counters["misses"] == 1
+    assert cache.counters["unspilled"] == 1
+
+    cache["a"]
+    assert cache.counters["hits"] == 1
+
+
+def test_spill_to_disk(tmpdir):
+    cache = _make_cache(device_budget=100, host_budget=0, spill_directory=str(tmpdir))
+    for i in range(4):
+        cache[i] = np.full(10, i, dtype="i8")
+    assert [cache.location(i) for i in range(3)] == ["disk"] * 3
+    assert len(tmpdir.listdir()) == 3
+    assert cache.counters["spilled_to_disk"] == 3
+
+    np.testing.assert_array_equal(cache[1], np.full(10, 1))
+    assert cache.location(1) == "device"
+    assert cache.location(3) == "disk"
+    assert len(tmpdir.listdir()) == 3
+
+    del cache[0]
+    assert 0 not in cache
+    assert len(cache) == 3
+    cache.clear()
+    assert len(cache) == 0
+    assert not tmpdir.exists()
+
+
+def test_oversized_partition_goes_to_host():
+    cache = _make_cache(device_budget=10)
+    cache["x"] = pd.DataFrame({"a": np.arange(100)})
+    assert cache.location("x") == "host"
+    assert cache.device_bytes == 0
+
+
+def test_persist_with_cache():
+    np.random.seed(0)
+    df = pd.DataFrame(
+        {"x": np.random.randint(0, 5, size=1000), "y": np.random.normal(size=1000)}
+    )
+    ddf = dgd.from_cudf(cudf.DataFrame.from_pandas(df), npartitions=4)
+
+    cache = PartitionCache(device_budget="8 kB")
+    persisted = ddf.persist(cache=cache)
+    assert len(cache) == persisted.npartitions
+    assert cache.counters["spilled_to_host"] > 0
+    assert cache.device_bytes <= cache.device_budget
+
+    assert_frame_equal(persisted.compute().to_pandas(), df)
+    assert cache.counters["unspilled"] > 0
+
+
+@pytest.mark.parametrize("budget", ["1 kB", 1000])
+def test_budget_parsing(budget):
+    assert _make_cache(device_budget=budget).device_budget == 1000
@@ -0,0 +1,95 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.util.testing import assert_frame_equal
+
+import cudf
+import dask_cudf as dgd
+from dask_cudf import utils
+
+
+def test_meta_nonempty():
+    meta = cudf.DataFrame(
+        [
+            ("a", np.zeros(0, dtype="i4")),
+            ("b", np.zeros(0, dtype="f8")),
+            ("c", np.zeros(0, dtype="datetime64[ms]")),
+            ("d", np.zeros(0, dtype="bool")),
+        ]
+    )
+    out = utils.meta_nonempty(meta)
+    assert len(out) == 2
+    assert list(out.columns) == list(meta.columns)
+    assert list(out.dtypes) == list(meta.dtypes)
+
+    sr = utils.meta_nonempty(meta.a)
+    assert len(sr) == 2
+    assert sr.name == "a"
+    assert sr.dtype == np.dtype("i4")
+
+
+def test_meta_nonempty_is_memoized():
+    meta = cudf.DataFrame([("x", np.zeros(0, dtype="i8"))])
+    utils.meta_nonempty(meta)
+    hits = utils._nonempty_from_schema.cache_info().hits
+    first = utils.meta_nonempty(meta)
+    assert utils._nonempty_from_schema.cache_info().hits > hits
+
+    # Callers get their own copy
+    first["y"] = first.x
+    assert list(utils.meta_nonempty(meta).columns) == ["x"]
+
+
+@pytest.mark.parametrize(
+    "meta",
+    [
+        pd.DataFrame({"a": pd.Categorical([])}),
+        pd.DataFrame({"a": np.zeros(0)}, index=pd.CategoricalIndex([])),
+    ],
+)
+def test_schema_key_skips_categoricals(meta):
+    assert utils._schema_key(meta) is None
+
+
+def test_make_meta_from_dtypes():
+    meta = utils.make_meta([("a", "i8"), ("b", "f4")])
+    assert isinstance(meta, cudf.DataFrame)
+    assert list(meta.columns) == ["a", "b"]
+    assert list(meta.dtypes) == [np.dtype("i8"), np.dtype("f4")]
+
+
+def test_schema_is_interned():
+    a = cudf.DataFrame([("x", np.zeros(3, dtype="i8")), ("y", np.ones(3))])
+    b = cudf.DataFrame([("x", np.arange(5, dtype="i8")), ("y", np.zeros(5))])
+    schema = utils.Schema.of(a)
+    assert schema is utils.Schema.of(b)
+    assert pickle.loads(pickle.dumps(schema)) is schema
+
+    meta = schema.to_meta()
+    assert list(meta.columns) == ["x", "y"]
+    assert list(meta.dtypes) == list(a.dtypes)
+    assert utils.check_schema(b, schema) is b
+
+
+def test_frame_pickles_schema():
+    gdf = cudf.DataFrame([("x", np.arange(10)), ("y", np.arange(10) * 2.0)])
+    ddf = dgd.from_cudf(gdf, npartitions=2)
+    state = ddf.__getstate__()
+    assert isinstance(state[2], utils.Schema)
+
+    ddf2 = pickle.loads(pickle.dumps(ddf))
+    # The meta is only rebuilt on access
+    assert ddf2._meta_obj is None
+    assert list(ddf2._meta.dtypes) == list(gdf.dtypes)
+    assert_frame_equal(ddf2.compute().to_pandas(), gdf.to_pandas())
+
+
+@pytest.mark.parametrize("dtype", ["i8", "f4", "bool", "datetime64[ms]"])
+def test_null_column(dtype):
+    sr = utils.null_column(100, dtype)
+    assert len(sr) == 100
+    assert sr.dtype == np.dtype(dtype)
+    assert sr.null_count == 100
+    assert sr.to_pandas().isnull().all()
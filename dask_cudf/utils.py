@@ -1,8 +1,14 @@
+import weakref
+from functools import lru_cache
+
 import dask.dataframe as dd
+import numpy as np
 import pandas as pd
 from dask.utils import asciitable
 
 import cudf
+from cudf.utils import cudautils
+from cudf.utils.utils import calc_chunk_size, mask_bitsize, mask_dtype
 
 
 def make_meta(x):
@@ -37,6 +43,9 @@ def make_meta(x):
     meta = dd.utils.make_meta(x)
 
     if isinstance(meta, (pd.DataFrame, pd.Series, pd.Index)):
+        key = _schema_key(meta)
+        if key is not None:
+            return _nonempty_from_schema(key).copy()
         meta2 = dd.utils.meta_nonempty(meta)
         if isinstance(meta2, pd.DataFrame):
             return cudf.DataFrame.from_pandas(meta2)
@@ -50,6 +59,142 @@ def make_meta(x):
     return meta
 
 
+def meta_nonempty(x):
+    """Create a nonempty cudf object with the same schema as *x*.
+
+    The fake rows are built straight from the dtypes, without a round trip
+    through pandas, and memoized per schema.
+
+    Parameters
+    ----------
+    x : cudf.DataFrame, cudf.Series or cudf.Index
+    """
+    key = _schema_key(x)
+    if key is None:
+        # Categories are part of the dtype, go through pandas
+        return cudf.from_pandas(dd.utils.meta_nonempty(x.to_pandas()))
+    return _nonempty_from_schema(key).copy()
+
+
+def _schema_key(x):
+    """A hashable description of the names, dtypes and index of *x*, or
+    None if some dtype is not a plain numpy dtype.
+
+    *x* may be a pandas or a cudf object.
+    """
+    if isinstance(x, (pd.Index, cudf.Index)):
+        if not isinstance(x.dtype, np.dtype):
+            return None
+        kind = "range" if isinstance(x, (pd.RangeIndex, cudf.RangeIndex)) else ""
+        return ("Index", kind, x.dtype, x.name)
+
+    index_key = _schema_key(x.index)
+    if index_key is None:
+        return None
+    if isinstance(x, (pd.DataFrame, cudf.DataFrame)):
+        dtypes = tuple(x.dtypes)
+        if not dtypes or not all(isinstance(d, np.dtype) for d in dtypes):
+            return None
+        return ("DataFrame", tuple(x.columns), dtypes, index_key)
+    if not isinstance(x.dtype, np.dtype):
+        return None
+    return ("Series", x.name, x.dtype, index_key)
+
+
+class Schema(object):
+    """The names, dtypes and index type of a cudf object.
+
+    Schemas are interned, so equal schemas are the same object within a
+    process, and they pickle as their small hashable key only.  A meta
+    object is rebuilt from the dtypes only when it is needed.
+
+    Use ``Schema.of`` to get the schema of a cudf or pandas object.
+    """
+
+    _interned = weakref.WeakValueDictionary()
+
+    def __new__(cls, key):
+        try:
+            return cls._interned[key]
+        except KeyError:
+            self = object.__new__(cls)
+            self.key = key
+            cls._interned[key] = self
+            return self
+
+    def __reduce__(self):
+        return (Schema, (self.key,))
+
+    def __repr__(self):
+        return "<Schema %r>" % (self.key,)
+
+    @classmethod
+    def of(cls, x):
+        """The schema of *x*, or None if it cannot be described by plain
+        numpy dtypes, e.g. because of categorical columns.
+        """
+        key = _schema_key(x)
+        return None if key is None else cls(key)
+
+    def to_meta(self):
+        """Build a new nonempty cudf object with this schema"""
+        return _nonempty_from_schema(self.key).copy()
+
+
+def check_schema(x, schema, funcname=None):
+    """Check that partition *x* matches *schema*, see
+    ``dask.dataframe.utils.check_meta``.
+    """
+    meta = _nonempty_from_schema(schema.key)
+    return dd.utils.check_meta(x, meta, funcname=funcname)
+
+
+def _fake_values(dtype):
+    if dtype.kind == "O":
+        return ["foo", "foo"]
+    elif dtype.kind == "b":
+        return np.array([True, False])
+    elif dtype.kind in "mM":
+        return np.zeros(2, dtype=dtype)
+    return np.ones(2, dtype=dtype)
+
+
+@lru_cache(maxsize=1024)
+def _nonempty_from_schema(key):
+    kind = key[0]
+    if kind == "Index":
+        _, index_kind, dtype, name = key
+        if index_kind == "range":
+            index = cudf.RangeIndex(0, 2)
+        else:
+            index = cudf.dataframe.index.as_index(_fake_values(dtype))
+        index.name = name
+        return index
+    elif kind == "Series":
+        _, name, dtype, index_key = key
+        index = _nonempty_from_schema(index_key)
+        return cudf.Series(_fake_values(dtype), index=index, name=name)
+    else:
+        _, names, dtypes, index_key = key
+        df = cudf.DataFrame()
+        for name, dtype in zip(names, dtypes):
+            df[name] = _fake_values(dtype)
+        return df.set_index(_nonempty_from_schema(index_key))
+
+
+def null_column(nelem, dtype):
+    """Create a cudf Series of *nelem* nulls of *dtype*.
+
+    Data and mask are allocated and zeroed on the device, so no host buffer
+    is built or uploaded.
+    """
+    dtype = np.dtype(dtype)
+    # Zero the data through an integer view, which works for any dtype
+    data = cudautils.zeros(nelem, dtype="i%d" % dtype.itemsize).view(dtype)
+    mask = cudautils.zeros(calc_chunk_size(nelem, mask_bitsize), dtype=mask_dtype)
+    return cudf.Series.from_masked_array(data=data, mask=mask, null_count=nelem)
+
+
 def check_meta(x, meta, funcname=None):
     """Check that the dask metadata matches the result.
     If metadata matches, ``x`` is passed through unchanged. A nice error is